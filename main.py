@@ -3,6 +3,8 @@ Main application class for the STL to GCode Converter using PyQt6.
 """
 import sys
 import os
+import atexit
+import tempfile
 import time  # Added for time-based progress tracking
 import logging
 from scripts.logger import get_logger
@@ -17,32 +19,20 @@ from PyQt6.QtWidgets import (
     QStyle, QFrame, QStatusBar, QToolBar, QPlainTextEdit, QSizePolicy, QTextEdit
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, pyqtSlot, QTimer, QSettings, QSize, QObject
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-from mpl_toolkits.mplot3d import art3d
-from stl import mesh
 from scripts.version import __version__
-from scripts.about import AboutDialog
-from scripts.sponsor import SponsorDialog
-from scripts.help import show_help
-from scripts.updates import UpdateChecker  # Import the new UpdateChecker class
 from scripts.ui_qt import UI  # Import the new UI module
-from scripts.log_viewer import LogViewer  # Import the LogViewer
-from scripts.gcode_optimizer import GCodeOptimizer
 from scripts.workers import GCodeGenerationWorker, STLLoadingWorker
-from scripts.stl_processor import MemoryEfficientSTLProcessor, STLHeader, STLTriangle
-from scripts.STL_load import open_stl_file, show_file_open_error  # Add this import
-from scripts.gcode_load import open_gcode_file, show_file_open_error
+from scripts.stl_processor import MemoryEfficientSTLProcessor
+from scripts.STL_load import open_stl_file  # Add this import
 from scripts.gcode_save import save_gcode_file, show_file_save_error
 from scripts.STL_view import STLVisualizer  # Add STLVisualizer import
 import numpy as np
-from PyQt6.Qsci import QsciScintilla, QsciLexerCustom
+from PyQt6.Qsci import QsciScintilla
 from PyQt6.QtGui import QColor, QFont
-from scripts.gcode_editor import GCodeEditorWidget
-from scripts.gcode_validator import PrinterLimits
-from scripts.view_settings import view_settings  # Add this import
-from scripts.logger import setup_logging, get_logger
+from scripts.logger import setup_logging, get_logger, shutdown_logging, LOG_LEVEL_ARG
 from PyQt6.QtCore import QSettings
 from scripts.progress import ProgressReporter  # Add import at the top of the file with other imports
 from scripts.language_manager import LanguageManager
@@ -68,6 +58,38 @@ except ImportError:
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Application icon, resolved once next to this file instead of the working directory
+ICON_PATH = Path(__file__).resolve().parent / "assets" / "icon.png"
+
+# Settings used for G-code generation, copied for every run
+DEFAULT_GCODE_SETTINGS = {
+    'layer_height': 0.2,
+    'extrusion_width': 0.4,
+    'filament_diameter': 1.75,
+    'print_speed': 60,
+    'travel_speed': 120,
+    'infill_speed': 60,
+    'first_layer_speed': 30,
+    'retraction_length': 5,
+    'retraction_speed': 40,
+    'z_hop': 0.2,
+    'infill_density': 20,
+    'infill_pattern': 'grid',
+    'infill_angle': 45,
+    'enable_arc_detection': True,
+    'arc_tolerance': 0.05,
+    'min_arc_segments': 5,
+    'enable_optimized_infill': True,
+    'infill_resolution': 1.0,
+    'start_gcode': "; Custom start G-code\nG28 ; Home all axes\nG1 Z5 F5000 ; Lift nozzle\n",
+    'end_gcode': "; Custom end G-code\nM104 S0 ; Turn off extruder\nM140 S0 ; Turn off bed\nG28 X0 Y0 ; Home X and Y axes\nM84 ; Disable motors\n",
+    'bed_temp': 60,
+    'extruder_temp': 200,
+    'fan_speed': 100,
+    'material': 'PLA'
+}
+
+
 class STLToGCodeApp(QMainWindow):
     """
     Main application window for the STL to GCode Converter.
@@ -110,6 +132,7 @@ class STLToGCodeApp(QMainWindow):
         # Initialize other attributes
         self.current_file = None
         self.stl_mesh = None
+        self.mesh_bounds = None  # (min, max) corners of the loaded mesh, computed once
         self.file_path = None
         self.worker_thread = None
         self.worker = None
@@ -117,13 +140,9 @@ class STLToGCodeApp(QMainWindow):
         # Set window properties
         self.setWindowTitle("STL to GCode Converter")
         
-        # Set application icon
-        icon_path = Path("assets/icon.png")
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
-            self.logger.info(f"Loaded application icon from {icon_path}")
-        else:
-            self.logger.warning(f"Icon not found at {icon_path}")
+        # Set application icon once the event loop runs, so decoding it does
+        # not delay the first paint of the window
+        QTimer.singleShot(0, self._load_window_icon)
         
         # Set window properties
         self.setWindowTitle(f"STL to GCode Converter v{__version__}")
@@ -135,8 +154,7 @@ class STLToGCodeApp(QMainWindow):
         # Add progressive loading attributes
         self.progressive_loading = True  # Enable progressive loading
         self.loading_progress = 0
-        self.current_vertices = np.zeros((0, 3), dtype=np.float32)
-        self.current_faces = np.zeros((0, 3), dtype=np.uint32)
+        self._reserve_mesh_buffers(0)
         self.loading_queue = []
         self.is_loading = False
         self.loading_timer = QTimer(self)
@@ -148,10 +166,12 @@ class STLToGCodeApp(QMainWindow):
         self.gcode_worker = None
         self.gcode_thread = None
         self.gcode_chunks = []
-        self.gcode_buffer = ""
+        self.gcode_buffer = []  # Pending chunks, joined once when flushed to the editor
+        self.gcode_buffer_length = 0
         self.gcode_buffer_size = 1024 * 1024  # 1MB buffer
-        self.gcode_update_timer = QTimer()
-        self.gcode_update_timer.timeout.connect(self._process_gcode_buffer)
+        self.gcode_output_path = None  # Temporary file the worker streams the G-code to
+        self.gcode_cancelled = False  # Set when the user cancels, checked once the worker stops
+        atexit.register(self._discard_gcode_output)
         
         # Set default printer limits (in mm) - must be before _setup_ui()
         self.printer_limits = {
@@ -174,6 +194,16 @@ class STLToGCodeApp(QMainWindow):
         # Update G-code action state
         self._update_gcode_action_state()
     
+    def _load_window_icon(self):
+        """Load the application icon and set it for all windows of the application."""
+        if ICON_PATH.is_file():
+            # Set on the application so dialogs opened later reuse the decoded
+            # icon instead of loading it from disk again
+            QApplication.setWindowIcon(QIcon(str(ICON_PATH)))
+            self.logger.info(f"Loaded application icon from {ICON_PATH}")
+        else:
+            self.logger.warning(f"Icon not found at {ICON_PATH}")
+    
     def _setup_ui(self):
         """Set up the main UI components using the UI module."""
         # Main widget and layout
@@ -225,15 +255,17 @@ class STLToGCodeApp(QMainWindow):
                 return
             
             # Get the layer bounds
-            if hasattr(self.stl_mesh, 'vertices') and hasattr(self.stl_mesh.vertices, '__array__'):
-                vertices = self.stl_mesh.vertices
-            elif isinstance(self.stl_mesh, dict) and 'vertices' in self.stl_mesh:
-                vertices = self.stl_mesh['vertices']
+            if getattr(self, 'mesh_bounds', None) is not None:
+                (x_min, y_min, _), (x_max, y_max, _) = self.mesh_bounds
             else:
-                return
-                
-            x_min, y_min = vertices[:, 0].min(), vertices[:, 1].min()
-            x_max, y_max = vertices[:, 0].max(), vertices[:, 1].max()
+                if hasattr(self.stl_mesh, 'vertices') and hasattr(self.stl_mesh.vertices, '__array__'):
+                    vertices = self.stl_mesh.vertices
+                elif isinstance(self.stl_mesh, dict) and 'vertices' in self.stl_mesh:
+                    vertices = self.stl_mesh['vertices']
+                else:
+                    return
+                x_min, y_min = vertices[:, :2].min(axis=0)
+                x_max, y_max = vertices[:, :2].max(axis=0)
             bounds = (x_min, y_min, x_max, y_max)
             
             # Generate infill pattern
@@ -272,8 +304,8 @@ class STLToGCodeApp(QMainWindow):
 
     def toggle_infill_visibility(self, state):
         """Toggle infill visibility in the 3D view."""
+        # The visualizer schedules its own redraw
         self.stl_visualizer.toggle_infill(state == Qt.CheckState.Checked.value)
-        self.canvas.draw_idle()
 
     def change_infill_color(self):
         """Open a color dialog to change the infill color."""
@@ -544,6 +576,9 @@ class STLToGCodeApp(QMainWindow):
     
     def open_file(self, file_path=None):
         """Open an STL file and load it into the viewer with progressive loading."""
+        # Only needed for the error dialogs, so not imported at startup
+        from scripts.gcode_load import show_file_open_error
+        
         # Reset any existing loading state
         self._reset_loading_state()
         
@@ -595,19 +630,15 @@ class STLToGCodeApp(QMainWindow):
             self.current_stl_processor = None
             
         self.loading_progress = 0
-        self.current_vertices = np.zeros((0, 3), dtype=np.float32)
-        self.current_faces = np.zeros((0, 3), dtype=np.uint32)
+        self._reserve_mesh_buffers(0)
+        self.mesh_bounds = None
         self.loading_queue = []
         self.is_loading = False
         self.loading_timer.stop()
         
-        # Only clear the visualization if it's been initialized
-        if hasattr(self, 'ax') and hasattr(self, 'canvas'):
-            try:
-                self.ax.clear()
-                self.canvas.draw()
-            except Exception as e:
-                logger.warning(f"Error resetting visualization: {str(e)}")
+        # The previous model stays on screen until the new one is rendered: the
+        # visualizer then swaps the vertices of its existing collection rather
+        # than clearing the axes and building the 3D artists again
     
     def _start_progressive_loading(self):
         """Start the progressive loading process in a background thread."""
@@ -640,6 +671,7 @@ class STLToGCodeApp(QMainWindow):
             self.is_loading = True
             self.loaded_triangles = 0
             self.total_triangles = total_triangles
+            self._reserve_mesh_buffers(total_triangles)
             
             # Create and configure worker thread
             logger.debug("Creating worker thread...")
@@ -733,6 +765,52 @@ class STLToGCodeApp(QMainWindow):
                 # If we encounter an error, try to continue with the next chunk
                 continue
     
+    def _reserve_mesh_buffers(self, num_triangles):
+        """Allocate the buffers the loaded chunks are copied into.
+        
+        Args:
+            num_triangles: Expected number of triangles; every triangle
+                brings its own three vertices
+        """
+        self._vertex_buffer = np.empty((3 * num_triangles, 3), dtype=np.float32)
+        self._face_buffer = np.empty((num_triangles, 3), dtype=np.uint32)
+        self._v_ptr = self._f_ptr = 0
+        self.current_vertices = self._vertex_buffer[:0]
+        self.current_faces = self._face_buffer[:0]
+    
+    def _append_mesh_chunk(self, new_vertices, new_faces):
+        """Copy a loaded chunk into the mesh buffers.
+        
+        The buffers are sized from the STL header up front, so each chunk is a
+        slice copy instead of a vstack of everything loaded so far. They only
+        grow (doubling) when the header undercounts the triangles.
+        current_vertices and current_faces are kept as views of the filled part.
+        """
+        nv = len(new_vertices)
+        nf = len(new_faces)
+        
+        if self._v_ptr + nv > len(self._vertex_buffer):
+            grown = np.empty((max(2 * len(self._vertex_buffer), self._v_ptr + nv), 3), dtype=np.float32)
+            grown[:self._v_ptr] = self._vertex_buffer[:self._v_ptr]
+            self._vertex_buffer = grown
+        if self._f_ptr + nf > len(self._face_buffer):
+            grown = np.empty((max(2 * len(self._face_buffer), self._f_ptr + nf), 3), dtype=np.uint32)
+            grown[:self._f_ptr] = self._face_buffer[:self._f_ptr]
+            self._face_buffer = grown
+        
+        vertex_offset = self._v_ptr
+        self._vertex_buffer[self._v_ptr:self._v_ptr + nv] = new_vertices
+        self._v_ptr += nv
+        
+        # Offset the face indices straight into the buffer
+        if nf:
+            target = self._face_buffer[self._f_ptr:self._f_ptr + nf]
+            np.add(new_faces.reshape(-1, 3), vertex_offset, out=target, casting='unsafe')
+            self._f_ptr += nf
+        
+        self.current_vertices = self._vertex_buffer[:self._v_ptr]
+        self.current_faces = self._face_buffer[:self._f_ptr]
+    
     def _process_chunk(self, chunk_data):
         """Process a single chunk of STL data."""
         if not chunk_data or 'vertices' not in chunk_data:
@@ -747,32 +825,17 @@ class STLToGCodeApp(QMainWindow):
                     self.progress_dialog.setValue(self.loading_progress)
             
             # Get vertices and faces from chunk
-            new_vertices = np.array(chunk_data['vertices'], dtype=np.float32)
-            new_faces = np.array(chunk_data.get('faces', []), dtype=np.uint32)
+            new_vertices = np.asarray(chunk_data['vertices'], dtype=np.float32)
+            new_faces = np.asarray(chunk_data.get('faces', []), dtype=np.uint32)
             
             if len(new_vertices) == 0:
                 logger.warning("Received chunk with no vertices")
                 return
             
-            # Initialize arrays if they don't exist
-            if not hasattr(self, 'current_vertices') or self.current_vertices is None:
-                self.current_vertices = np.zeros((0, 3), dtype=np.float32)
-            if not hasattr(self, 'current_faces') or self.current_faces is None:
-                self.current_faces = np.zeros((0, 3), dtype=np.uint32)
-            
-            # Calculate the offset for face indices
-            vertex_offset = len(self.current_vertices)
-            
-            # Add the new vertices
-            self.current_vertices = np.vstack((self.current_vertices, new_vertices))
+            self._append_mesh_chunk(new_vertices, new_faces)
             
-            # If we have faces, add them with the correct offset
-            if len(new_faces) > 0:
-                new_faces_offset = new_faces + vertex_offset
-                self.current_faces = np.vstack((self.current_faces, new_faces_offset))
-            
-            logger.debug(f"Processed chunk. Total vertices: {len(self.current_vertices)}, "
-                       f"Total faces: {len(self.current_faces)}")
+            logger.debug("Processed chunk. Total vertices: %d, Total faces: %d",
+                         len(self.current_vertices), len(self.current_faces))
             
         except Exception as e:
             logger.error(f"Error in _process_chunk: {str(e)}", exc_info=True)
@@ -804,33 +867,18 @@ class STLToGCodeApp(QMainWindow):
                 
             try:
                 # Convert vertices to numpy array and ensure shape is (N, 3)
-                new_vertices = np.array(chunk_data['vertices'], dtype=np.float32)
+                new_vertices = np.asarray(chunk_data['vertices'], dtype=np.float32)
                 if new_vertices.ndim == 1:
                     # Reshape flat array to (N, 3)
                     new_vertices = new_vertices.reshape(-1, 3)
                 
                 # Convert faces to numpy array if they exist
-                new_faces = np.array(chunk_data.get('faces', []), dtype=np.uint32)
-                
-                # Initialize arrays if they don't exist
-                if not hasattr(self, 'current_vertices') or self.current_vertices is None:
-                    self.current_vertices = np.zeros((0, 3), dtype=np.float32)
-                if not hasattr(self, 'current_faces') or self.current_faces is None:
-                    self.current_faces = np.zeros((0, 3), dtype=np.uint32)
-                
-                # Store the current vertex count for face index offset
-                vertex_offset = self.current_vertices.shape[0]
+                new_faces = np.asarray(chunk_data.get('faces', []), dtype=np.uint32)
                 
-                # Add the new vertices
-                self.current_vertices = np.vstack((self.current_vertices, new_vertices))
+                self._append_mesh_chunk(new_vertices, new_faces)
                 
-                # If we have faces, add them with the correct offset
-                if len(new_faces) > 0:
-                    new_faces_offset = new_faces + vertex_offset
-                    self.current_faces = np.vstack((self.current_faces, new_faces_offset.reshape(-1, 3)))
-                
-                logger.debug(f"Processed chunk. Total vertices: {len(self.current_vertices)}, "
-                           f"Total faces: {len(self.current_faces)}")
+                logger.debug("Processed chunk. Total vertices: %d, Total faces: %d",
+                             len(self.current_vertices), len(self.current_faces))
                 
                 # If this is the final chunk, update visualization
                 if chunk_data.get('is_final', False):
@@ -852,19 +900,10 @@ class STLToGCodeApp(QMainWindow):
             return
             
         try:
-            # Get the current cursor position
-            cursor = self.gcode_editor.textCursor()
-            position = cursor.position()
-            
             # Append the buffered G-code to the editor
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.gcode_editor.setTextCursor(cursor)
-            self.gcode_editor.insertPlainText(self.gcode_buffer)
-            self.gcode_buffer = ""
-            
-            # Restore the cursor position
-            cursor.setPosition(position)
-            self.gcode_editor.setTextCursor(cursor)
+            self._append_gcode_editor_text("".join(self.gcode_buffer))
+            self.gcode_buffer = []
+            self.gcode_buffer_length = 0
             
         except Exception as e:
             logger.error(f"Error processing G-code buffer: {str(e)}", exc_info=True)
@@ -882,8 +921,14 @@ class STLToGCodeApp(QMainWindow):
             QMessageBox.warning(self, "Error", "No G-code editor is available.")
             return False
         
-        # Get the content from the editor
-        content = editor.toPlainText()
+        # Copy the streamed G-code file when the editor still holds exactly the
+        # generated G-code, instead of materializing and re-encoding its text
+        source_path = None
+        content = ""
+        if self.gcode_output_path and not self._is_gcode_editor_modified(editor):
+            source_path = self.gcode_output_path
+        else:
+            content = self._gcode_editor_text(editor)
         
         # If file_path is provided, use it as the default filename
         default_filename = file_path if file_path else getattr(self, 'gcode_file_path', '')
@@ -892,7 +937,8 @@ class STLToGCodeApp(QMainWindow):
         result = save_gcode_file(
             parent=self,
             content=content,
-            default_filename=default_filename
+            default_filename=default_filename,
+            source_path=source_path
         )
         
         if result['success']:
@@ -904,7 +950,7 @@ class STLToGCodeApp(QMainWindow):
             self._add_to_recent_files(self.gcode_file_path)
             
             # Update status bar
-            self.statusBar().showMessage(f"G-code saved to {result['file_name']}", 3000)
+            self.status_bar.showMessage(f"G-code saved to {result['file_name']}", 3000)
         else:
             # Show error message if save failed
             show_file_save_error(self, result)
@@ -927,7 +973,7 @@ class STLToGCodeApp(QMainWindow):
             if dialog.exec() == QDialog.DialogCode.Accepted:  # Use QDialog.DialogCode
                 # Save the settings
                 self.settings = dialog.get_settings()
-                self.statusBar().showMessage("Settings saved", 3000)
+                self.status_bar.showMessage("Settings saved", 3000)
                 logger.info("Application settings updated")
                 
                 # Apply any settings that need immediate effect
@@ -997,26 +1043,35 @@ class STLToGCodeApp(QMainWindow):
         except Exception as e:
             logger.error(f"Error applying theme '{theme_name}': {str(e)}", exc_info=True)
     
-    def toggle_log_viewer(self):
-        """Toggle the visibility of the log viewer."""
+    def toggle_log_viewer(self, checked=None):
+        """Show or hide the log viewer dock, building it the first time it is shown.
+        
+        Args:
+            checked: True to show the log viewer, False to hide it, None to toggle it.
+        """
         try:
-            if not hasattr(self, 'log_viewer') or not self.log_viewer:
-                # Create and show the log viewer if it doesn't exist
+            if checked is None:
+                checked = self.log_viewer is None or not self.log_viewer.isVisible()
+            
+            if self.log_viewer is None:
+                if not checked:
+                    return
+                # Build the dock once, hidden, and keep it docked from then on
                 from scripts.log_viewer import LogViewer
-                self.log_viewer = LogViewer()
-                self.log_viewer.show()
-                self.toggle_log_viewer_action.setText("Hide Log Viewer")
+                self.log_viewer = LogViewer(self)
+                self.log_viewer.setVisible(False)
+                self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.log_viewer)
                 logger.info("Log viewer opened")
-            else:
-                # Toggle visibility if it exists
-                if self.log_viewer.isVisible():
-                    self.log_viewer.hide()
-                    self.toggle_log_viewer_action.setText("Show Log Viewer")
-                    logger.debug("Log viewer hidden")
-                else:
-                    self.log_viewer.show()
-                    self.toggle_log_viewer_action.setText("Hide Log Viewer")
-                    logger.debug("Log viewer shown")
+            
+            self.log_viewer.setVisible(checked)
+            logger.debug(f"Log viewer {'shown' if checked else 'hidden'}")
+            
+            # Keep the menu action in sync when toggled through the shortcut
+            action = getattr(self, 'toggle_log_viewer_action', None)
+            if action is not None and action.isChecked() != checked:
+                action.blockSignals(True)
+                action.setChecked(checked)
+                action.blockSignals(False)
                     
         except ImportError as e:
             error_msg = "Log viewer module not available"
@@ -1055,36 +1110,17 @@ class STLToGCodeApp(QMainWindow):
             self.progress_dialog.setMinimumDuration(0)
             
             # Get current settings (you may want to get these from a settings dialog)
-            settings = {
-                'layer_height': 0.2,
-                'extrusion_width': 0.4,
-                'filament_diameter': 1.75,
-                'print_speed': 60,
-                'travel_speed': 120,
-                'infill_speed': 60,
-                'first_layer_speed': 30,
-                'retraction_length': 5,
-                'retraction_speed': 40,
-                'z_hop': 0.2,
-                'infill_density': 20,
-                'infill_pattern': 'grid',
-                'infill_angle': 45,
-                'enable_arc_detection': True,
-                'arc_tolerance': 0.05,
-                'min_arc_segments': 5,
-                'enable_optimized_infill': True,
-                'infill_resolution': 1.0,
-                'start_gcode': "; Custom start G-code\nG28 ; Home all axes\nG1 Z5 F5000 ; Lift nozzle\n",
-                'end_gcode': "; Custom end G-code\nM104 S0 ; Turn off extruder\nM140 S0 ; Turn off bed\nG28 X0 Y0 ; Home X and Y axes\nM84 ; Disable motors\n",
-                'bed_temp': 60,
-                'extruder_temp': 200,
-                'fan_speed': 100,
-                'material': 'PLA'
-            }
+            settings = dict(DEFAULT_GCODE_SETTINGS)
+            
+            # Stream the G-code to a temporary file while it is generated
+            self._start_gcode_output()
             
             # Create worker and thread for G-code generation
             self.gcode_thread = QThread()
-            self.gcode_worker = GCodeGenerationWorker(self.stl_mesh, settings)
+            self.gcode_worker = GCodeGenerationWorker(
+                self.stl_mesh, settings, bounds=self.mesh_bounds,
+                output_path=self.gcode_output_path
+            )
             self.gcode_worker.moveToThread(self.gcode_thread)
             
             # Connect signals
@@ -1115,18 +1151,21 @@ class STLToGCodeApp(QMainWindow):
             self.progress_dialog.setValue(current)
             
             # Update status bar
-            self.statusBar().showMessage(f"Generating G-code: {current}/{total} layers")
+            self.status_bar.showMessage(f"Generating G-code: {current}/{total} layers")
     
     def _process_gcode_chunk(self, chunk):
         """Process a chunk of generated G-code."""
         try:
             if not hasattr(self, 'gcode_buffer'):
-                self.gcode_buffer = ""
-                
-            self.gcode_buffer += chunk
+                self.gcode_buffer = []
+                self.gcode_buffer_length = 0
+            
+            # Appending to a list keeps buffering linear in the G-code size
+            self.gcode_buffer.append(chunk)
+            self.gcode_buffer_length += len(chunk)
             
             # If buffer is large enough, update the editor
-            if len(self.gcode_buffer) > self.gcode_buffer_size:
+            if self.gcode_buffer_length > self.gcode_buffer_size:
                 self._process_gcode_buffer()
                 
         except Exception as e:
@@ -1145,11 +1184,21 @@ class STLToGCodeApp(QMainWindow):
     def _on_gcode_generation_finished(self):
         """Handle completion of G-code generation."""
         try:
-            # Stop the update timer
-            self.gcode_update_timer.stop()
-            
-            # Process any remaining G-code in the buffer
-            self._process_gcode_buffer()
+            if self.gcode_cancelled:
+                # Partial output is dropped rather than shown as a finished result:
+                # the run started on an empty editor, so this also removes the
+                # blocks already flushed to it
+                self.gcode_buffer = []
+                self.gcode_buffer_length = 0
+                if self.gcode_editor is not None:
+                    self.gcode_editor.clear()
+            else:
+                # Process any remaining G-code in the buffer
+                self._process_gcode_buffer()
+                
+                # The editor now matches the streamed file
+                if self.gcode_editor is not None:
+                    self._set_gcode_editor_modified(False)
             
             # Clean up the worker thread
             if hasattr(self, 'gcode_worker'):
@@ -1162,11 +1211,14 @@ class STLToGCodeApp(QMainWindow):
                 self.gcode_thread = None
             
             # Close the progress dialog if it exists
-            if hasattr(self, 'progress_dialog') and self.progress_dialog:
-                self.progress_dialog.close()
+            self._close_gcode_progress_dialog()
+            
+            if self.gcode_cancelled:
+                self._discard_gcode_output()
+                return
             
             # Update the UI
-            self.statusBar().showMessage("G-code generation completed", 5000)
+            self.status_bar.showMessage("G-code generation completed", 5000)
             
             # Update G-code action states
             self._update_gcode_action_state()
@@ -1183,27 +1235,103 @@ class STLToGCodeApp(QMainWindow):
     def _on_gcode_generation_error(self, error_msg):
         """Handle errors during G-code generation."""
         try:
-            if hasattr(self, 'progress_dialog') and self.progress_dialog:
-                self.progress_dialog.close()
+            self._close_gcode_progress_dialog()
+            
+            self._discard_gcode_output()
                 
             QMessageBox.critical(self, "G-code Generation Error", error_msg)
-            self.statusBar().showMessage("G-code generation failed", 5000)
+            self.status_bar.showMessage("G-code generation failed", 5000)
             logger.error(f"G-code generation error: {error_msg}")
             
         except Exception as e:
             logger.error(f"Error handling G-code generation error: {str(e)}", exc_info=True)
     
+    def _start_gcode_output(self):
+        """Start a new G-code output: empty editor and buffer, fresh temporary file.
+        
+        The editor only ever holds the output of the current run, so saving an
+        unmodified editor can copy the streamed file instead of its text.
+        """
+        self.gcode_cancelled = False
+        self.gcode_buffer = []
+        self.gcode_buffer_length = 0
+        if self.gcode_editor is not None:
+            self.gcode_editor.clear()
+        self._discard_gcode_output()
+        fd, self.gcode_output_path = tempfile.mkstemp(suffix='.gcode')
+        os.close(fd)
+    
+    def _close_gcode_progress_dialog(self):
+        """Close the generation progress dialog without it reporting a cancel.
+        
+        QProgressDialog emits canceled when it is closed, which would reach
+        _cancel_gcode_generation once the run is already over.
+        """
+        if hasattr(self, 'progress_dialog') and self.progress_dialog:
+            blocked = self.progress_dialog.blockSignals(True)
+            self.progress_dialog.close()
+            self.progress_dialog.blockSignals(blocked)
+    
+    def _discard_gcode_output(self):
+        """Delete the temporary file holding the last generated G-code, if any."""
+        if self.gcode_output_path:
+            try:
+                os.remove(self.gcode_output_path)
+            except OSError as e:
+                logger.warning(f"Could not remove temporary G-code file: {str(e)}")
+            self.gcode_output_path = None
+    
+    def _append_gcode_editor_text(self, text):
+        """Append text at the end of the G-code editor, leaving the cursor where it is."""
+        if isinstance(self.gcode_editor, QsciScintilla):
+            self.gcode_editor.append(text)
+            return
+        
+        # Get the current cursor position
+        cursor = self.gcode_editor.textCursor()
+        position = cursor.position()
+        
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        self.gcode_editor.setTextCursor(cursor)
+        self.gcode_editor.insertPlainText(text)
+        
+        # Restore the cursor position
+        cursor.setPosition(position)
+        self.gcode_editor.setTextCursor(cursor)
+    
+    def _gcode_editor_text(self, editor):
+        """Return the full text of the G-code editor."""
+        if isinstance(editor, QsciScintilla):
+            return editor.text()
+        return editor.toPlainText()
+    
+    def _is_gcode_editor_modified(self, editor):
+        """Return True if the editor text was changed since it was last marked unmodified."""
+        if isinstance(editor, QsciScintilla):
+            return editor.isModified()
+        return editor.document().isModified()
+    
+    def _set_gcode_editor_modified(self, modified):
+        """Set the modified flag of the G-code editor."""
+        if isinstance(self.gcode_editor, QsciScintilla):
+            self.gcode_editor.setModified(modified)
+        else:
+            self.gcode_editor.document().setModified(modified)
+    
     def _cancel_gcode_generation(self):
         """Cancel the ongoing G-code generation."""
         try:
-            if hasattr(self, 'gcode_worker') and self.gcode_worker:
-                self.gcode_worker.cancel()
-                
-            if hasattr(self, 'gcode_thread') and self.gcode_thread.isRunning():
-                self.gcode_thread.quit()
-                self.gcode_thread.wait()
+            # Only a run in progress can be cancelled
+            if not getattr(self, 'gcode_worker', None):
+                return
+            
+            # The worker checks the flag before every layer and then emits
+            # finished; the thread is cleaned up from there instead of
+            # blocking the UI here until the current layer is done
+            self.gcode_cancelled = True
+            self.gcode_worker.cancel()
                 
-            self.statusBar().showMessage("G-code generation cancelled", 5000)
+            self.status_bar.showMessage("G-code generation cancelled", 5000)
             logger.info("G-code generation cancelled by user")
             
         except Exception as e:
@@ -1212,7 +1340,15 @@ class STLToGCodeApp(QMainWindow):
     def show_about(self):
         """Show the About dialog using the AboutDialog class from scripts.about."""
         try:
-            about_dialog = AboutDialog(self)
+            # The dialog is built once and shown again on later requests
+            about_dialog = getattr(self, '_about_dialog', None)
+            if about_dialog is None or sip.isdeleted(about_dialog):
+                from scripts.about import AboutDialog
+                about_dialog = AboutDialog(self, language_manager=self.language_manager)
+                self._about_dialog = about_dialog
+            elif hasattr(about_dialog, 'sys_info'):
+                # Memory usage and the like may have changed since last time
+                about_dialog.sys_info.setHtml(about_dialog.get_system_info())
             about_dialog.exec()
         except Exception as e:
             logger.error(f"Error showing about dialog: {str(e)}", exc_info=True)
@@ -1221,7 +1357,12 @@ class STLToGCodeApp(QMainWindow):
     def show_sponsor(self):
         """Show the sponsor dialog using the SponsorDialog class from scripts.sponsor."""
         try:
-            sponsor_dialog = SponsorDialog(self)
+            # The dialog is built once and shown again on later requests
+            sponsor_dialog = getattr(self, '_sponsor_dialog', None)
+            if sponsor_dialog is None or sip.isdeleted(sponsor_dialog):
+                from scripts.sponsor import SponsorDialog
+                sponsor_dialog = SponsorDialog(self, language_manager=self.language_manager)
+                self._sponsor_dialog = sponsor_dialog
             sponsor_dialog.exec()  # Use exec() to show the dialog modally
         except Exception as e:
             logger.error(f"Error showing sponsor dialog: {str(e)}", exc_info=True)
@@ -1245,13 +1386,13 @@ class STLToGCodeApp(QMainWindow):
             force_check: If True, force a check even if recently checked.
         """
         try:
-            self.statusBar().showMessage("Checking for updates...")
+            self.status_bar.showMessage("Checking for updates...")
             QApplication.processEvents()  # Update the UI
             
             from scripts.updates import UpdateChecker
             
             # Store the current status bar message to restore it later
-            current_message = self.statusBar().currentMessage()
+            current_message = self.status_bar.currentMessage()
             
             def on_update_available(update_info):
                 try:
@@ -1295,7 +1436,7 @@ class STLToGCodeApp(QMainWindow):
                         f"You are running the latest version ({__version__}).",
                         QMessageBox.StandardButton.Ok
                     )
-                self.statusBar().showMessage("You are running the latest version", 3000)
+                self.status_bar.showMessage("You are running the latest version", 3000)
                 # Clean up the update checker
                 if hasattr(self, 'update_checker'):
                     self.update_checker.deleteLater()
@@ -1303,7 +1444,7 @@ class STLToGCodeApp(QMainWindow):
             
             def on_error(error_msg):
                 logger.error(f"Update check failed: {error_msg}")
-                self.statusBar().showMessage("Update check failed", 3000)
+                self.status_bar.showMessage("Update check failed", 3000)
                 if force_check:  # Only show error if user explicitly checked
                     QMessageBox.warning(
                         self,
@@ -1330,7 +1471,7 @@ class STLToGCodeApp(QMainWindow):
         except ImportError as e:
             error_msg = f"Failed to import update module: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            self.statusBar().showMessage("Update check failed: Missing module", 5000)
+            self.status_bar.showMessage("Update check failed: Missing module", 5000)
             if force_check:
                 QMessageBox.critical(
                     self,
@@ -1341,7 +1482,7 @@ class STLToGCodeApp(QMainWindow):
         except Exception as e:
             error_msg = f"Unexpected error during update check: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            self.statusBar().showMessage("Update check failed", 5000)
+            self.status_bar.showMessage("Update check failed", 5000)
             if force_check:
                 QMessageBox.critical(
                     self,
@@ -1378,12 +1519,13 @@ class STLToGCodeApp(QMainWindow):
             
             # Update the G-code editor
             self.gcode_editor.setPlainText(gcode_content)
+            self._discard_gcode_output()
             
             # Switch to the G-code tab
             self.tab_widget.setCurrentIndex(1)  # Assuming G-code tab is at index 1
             
             # Update status bar
-            self.statusBar().showMessage(f"Loaded G-code from {os.path.basename(file_path)}", 5000)
+            self.status_bar.showMessage(f"Loaded G-code from {os.path.basename(file_path)}", 5000)
             
             # Store the current file path
             self.current_file = file_path
@@ -1421,7 +1563,7 @@ class STLToGCodeApp(QMainWindow):
                     self.gcode_editor.setTextCursor(cursor)
                     
             # Update status bar with a temporary message
-            self.statusBar().showMessage("Viewing G-code Editor", 3000)
+            self.status_bar.showMessage("Viewing G-code Editor", 3000)
             
         except Exception as e:
             error_msg = f"Error viewing G-code: {str(e)}"
@@ -1436,8 +1578,9 @@ class STLToGCodeApp(QMainWindow):
                 logger.warning("No mesh data available to display")
                 return
                 
-            logger.debug(f"Updating visualization with {len(self.current_vertices)} vertices and "
-                       f"{len(self.current_faces) if hasattr(self, 'current_faces') else 0} faces")
+            logger.debug("Updating visualization with %d vertices and %d faces",
+                         len(self.current_vertices),
+                         len(self.current_faces) if hasattr(self, 'current_faces') else 0)
             
             # Ensure we have the STL visualizer
             if not hasattr(self, 'stl_visualizer') or self.stl_visualizer is None:
@@ -1475,11 +1618,12 @@ class STLToGCodeApp(QMainWindow):
                     logger.warning("No faces to display")
                     return
                 
-                # Log some debug info
-                logger.debug(f"Vertices shape: {vertices.shape}, dtype: {vertices.dtype}")
-                logger.debug(f"Faces shape: {faces.shape}, dtype: {faces.dtype}")
-                logger.debug(f"First few vertices: {vertices[:2]}")
-                logger.debug(f"First few faces: {faces[:2]}")
+                # Log some debug info (formatted lazily: the array reprs are not
+                # cheap and this runs on every redraw)
+                logger.debug("Vertices shape: %s, dtype: %s", vertices.shape, vertices.dtype)
+                logger.debug("Faces shape: %s, dtype: %s", faces.shape, faces.dtype)
+                logger.debug("First few vertices: %s", vertices[:2])
+                logger.debug("First few faces: %s", faces[:2])
                 
                 # Update the mesh in the visualizer
                 logger.debug("Updating mesh in visualizer...")
@@ -1634,7 +1778,7 @@ class STLToGCodeApp(QMainWindow):
     def _open_recent_file(self, file_path):
         """Open a file from the recent files list."""
         if os.path.exists(file_path):
-            self.load_stl_file(file_path)
+            self.open_file(file_path)
         else:
             # Remove non-existent file from recent files
             if file_path in self.recent_files:
@@ -1862,7 +2006,11 @@ class STLToGCodeApp(QMainWindow):
                     try:
                         # Try to create a mesh using trimesh if available
                         import trimesh
-                        self.stl_mesh = trimesh.Trimesh(vertices=self.current_vertices, faces=self.current_faces)
+                        # The arrays are already parsed and validated by the loader, so
+                        # wrap them as-is instead of letting trimesh merge vertices again
+                        self.stl_mesh = trimesh.Trimesh(vertices=self.current_vertices,
+                                                        faces=self.current_faces,
+                                                        process=False)
                         logger.debug("Created trimesh object from loaded data")
                     except ImportError:
                         # Fall back to a simple dictionary if trimesh is not available
@@ -1873,6 +2021,12 @@ class STLToGCodeApp(QMainWindow):
                         }
                         logger.debug("Created simple mesh dictionary from loaded data")
                     
+                    # Bounding box of the model, reused by every G-code generation
+                    self.mesh_bounds = (
+                        self.current_vertices.min(axis=0),
+                        self.current_vertices.max(axis=0)
+                    )
+                    
                     # Update the visualization with the loaded mesh
                     self._update_visualization()
                     logger.debug("Visualization update complete")
@@ -1885,8 +2039,7 @@ class STLToGCodeApp(QMainWindow):
                     logger.warning("No mesh data available to display")
                     
                 # Update status bar
-                if hasattr(self, 'statusBar'):
-                    self.statusBar().showMessage("STL file loaded successfully", 5000)
+                self.status_bar.showMessage("STL file loaded successfully", 5000)
             else:
                 # Show error message
                 if error_msg:
@@ -1925,7 +2078,7 @@ class STLToGCodeApp(QMainWindow):
     def show_help(self):
         """Show the help dialog."""
         from scripts.help import show_help
-        show_help(self)
+        show_help(self, language_manager=self.language_manager)
 
     def _update_gcode_action_state(self):
         """Update the enabled state of the G-code related actions."""
@@ -1936,15 +2089,71 @@ class STLToGCodeApp(QMainWindow):
             self.save_gcode_action.setEnabled(has_gcode)
 
 # Run the application
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
+def _build_app(argv):
+    """Create the QApplication with its attributes and style."""
+    # Application attributes must be set before the QApplication is created:
+    # share GL contexts between viewports, coalesce mouse-move/resize events
+    # and keep native window handles off sibling widgets
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
     
-    # Set application style
-    app.setStyle('Fusion')
+    # The log level argument was already read by scripts.logger; Qt does not need it
+    app = QApplication([arg for arg in argv if not arg.startswith(LOG_LEVEL_ARG)])
     
-    # Create and show the main window
+    # Set application style; STL2GCODE_STYLE picks another Qt style, or
+    # "native" to keep the platform style and skip loading a style plugin
+    style = os.environ.get("STL2GCODE_STYLE", "Fusion")
+    if style.lower() != "native":
+        app.setStyle(style)
+    return app
+
+
+def _build_main_window():
+    """Create and show the main window."""
     window = STLToGCodeApp()
     window.show()
+    return window
+
+
+def _handle_cli(app, window):
+    """Open an STL file given on the command line once the window has been painted."""
+    # The mesh itself is then loaded by the STL loading worker
+    args = app.arguments()[1:]
+    if args and os.path.isfile(args[0]):
+        QTimer.singleShot(0, lambda path=args[0]: window.open_file(path))
+
+
+def main():
+    """Start the application and run its event loop."""
+    # Set STL2GCODE_STARTUP_PROFILE to print how long each startup stage takes
+    profile = bool(os.environ.get("STL2GCODE_STARTUP_PROFILE"))
+    stage_start = time.perf_counter()
+    
+    def stage_done(stage):
+        nonlocal stage_start
+        if profile:
+            now = time.perf_counter()
+            print(f"startup: {stage} took {(now - stage_start) * 1000:.1f} ms", file=sys.stderr)
+            stage_start = now
     
-    # Start the event loop
-    sys.exit(app.exec())
+    log_file = setup_logging()  # Already configured on import; returns the log file
+    stage_done(f"logging ({log_file})")
+    app = _build_app(sys.argv)
+    stage_done("application")
+    window = _build_main_window()
+    stage_done("main window")
+    _handle_cli(app, window)
+    
+    # Start the event loop; whatever way it ends, write out the queued and
+    # buffered log records and close the log handlers before exiting
+    try:
+        exit_code = app.exec()
+    finally:
+        shutdown_logging()
+        logging.shutdown()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
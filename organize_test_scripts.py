@@ -5,7 +5,6 @@ Run this script from the root directory of the project.
 import os
 import shutil
 from pathlib import Path
-from scripts.logger import get_loggerPath
 
 def create_directory(directory):
     """Create a directory if it doesn't exist."""
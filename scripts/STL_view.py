@@ -21,6 +21,18 @@ class STLVisualizer:
     A class to handle visualization of STL files and infill patterns using matplotlib.
     """
     
+    # Above this number of faces the mesh is drawn without edges or antialiasing,
+    # which is where most of the Agg rasterization time of large meshes goes
+    LARGE_MESH_FACES = 50000
+    
+    # Above this number of faces only an evenly strided subset is drawn; the
+    # full mesh is kept in self.faces for everything else
+    MAX_PREVIEW_FACES = 200000
+    
+    # While the view is being rotated or zoomed with the mouse every motion event
+    # re-projects the whole collection, so a coarser subset is drawn until release
+    INTERACTIVE_PREVIEW_FACES = 20000
+    
     def __init__(self, ax, canvas, language_manager=language_manager):
         """
         Initialize the STL visualizer.
@@ -37,11 +49,17 @@ class STLVisualizer:
         
         self.vertices = np.zeros((0, 3), dtype=np.float32)
         self.faces = np.zeros((0, 3), dtype=np.uint32)
+        self.bounds = None  # (min, max) corners of self.vertices, kept up to date per chunk
         self.mesh = None
         self.file_path = None
         self.infill_lines = []  # Store infill line segments
         self.infill_collection = None  # Store the infill Line3DCollection
         self.show_infill = True  # Whether to show infill
+        self._interacting = False  # True while a mouse button is held over the axes
+        
+        # Draw a coarser mesh while the user drags the view around
+        self.canvas.mpl_connect('button_press_event', self._on_interaction_start)
+        self.canvas.mpl_connect('button_release_event', self._on_interaction_end)
         
         # Set up the 3D axes with better default settings
         self._setup_axes()
@@ -86,15 +104,28 @@ class STLVisualizer:
             new_vertices = np.asarray(vertices, dtype=np.float32)
             new_faces = np.asarray(faces, dtype=np.uint32)
             
+            # Bounds of the new vertices, in one pass per reduction
+            new_bounds = None
+            if len(new_vertices) > 0:
+                new_bounds = (new_vertices.min(axis=0), new_vertices.max(axis=0))
+            
             if is_chunk and len(self.vertices) > 0:
                 # For chunks, append to existing vertices and update face indices
                 vertex_offset = len(self.vertices)
                 self.vertices = np.vstack([self.vertices, new_vertices])
                 self.faces = np.vstack([self.faces, new_faces + vertex_offset])
+                
+                # Grow the bounds by the chunk instead of rescanning the whole mesh
+                if new_bounds is None:
+                    new_bounds = self.bounds
+                elif self.bounds is not None:
+                    new_bounds = (np.minimum(self.bounds[0], new_bounds[0]),
+                                  np.maximum(self.bounds[1], new_bounds[1]))
             else:
                 # For new meshes, replace existing data
                 self.vertices = new_vertices
                 self.faces = new_faces
+            self.bounds = new_bounds
             
             if file_path:
                 self.file_path = str(file_path)
@@ -112,10 +143,11 @@ class STLVisualizer:
         Update the infill lines to be visualized.
         
         Args:
-            infill_lines: List of (x1, y1, z1, x2, y2, z2) line segments
+            infill_lines: List of (x1, y1, z1, x2, y2, z2) line segments, or an
+                (M, 2, 3) array of segment end points
         """
         try:
-            self.infill_lines = np.array(infill_lines, dtype=np.float32)
+            self.infill_lines = np.asarray(infill_lines, dtype=np.float32)
             self._render_infill()
             return True
         except Exception as e:
@@ -124,30 +156,45 @@ class STLVisualizer:
 
     def _render_infill(self):
         """Render the infill lines."""
-        if not self.show_infill or len(self.infill_lines) == 0:
-            if self.infill_collection is not None:
+        attached = self.infill_collection is not None and self.infill_collection.axes is self.ax
+        
+        if len(self.infill_lines) == 0:
+            if attached:
                 self.infill_collection.remove()
-                self.infill_collection = None
+                self.canvas.draw_idle()
+            self.infill_collection = None
+            return
+        
+        if not self.show_infill:
+            # Hide the collection but keep it, so showing it again is free
+            if attached:
+                self.infill_collection.set_visible(False)
+                self.canvas.draw_idle()
             return
         
         # Create line segments in the correct format for Line3DCollection
         segments = self.infill_lines.reshape(-1, 2, 3)
+        alpha = self.infill_color[3] if len(self.infill_color) > 3 else 0.6
         
-        # Remove existing infill collection if it exists
-        if self.infill_collection is not None:
-            self.infill_collection.remove()
-        
-        # Create new line collection
-        self.infill_collection = Line3DCollection(
-            segments,
-            colors=self.infill_color,
-            linewidths=self.infill_width,
-            linestyles='-',
-            alpha=self.infill_color[3] if len(self.infill_color) > 3 else 0.6
-        )
-        
-        # Add to the axes
-        self.ax.add_collection3d(self.infill_collection)
+        if attached:
+            # Update the existing collection in place
+            self.infill_collection.set_segments(segments)
+            self.infill_collection.set_color(self.infill_color)
+            self.infill_collection.set_linewidth(self.infill_width)
+            self.infill_collection.set_alpha(alpha)
+            self.infill_collection.set_visible(True)
+        else:
+            # Create new line collection
+            self.infill_collection = Line3DCollection(
+                segments,
+                colors=self.infill_color,
+                linewidths=self.infill_width,
+                linestyles='-',
+                alpha=alpha
+            )
+            
+            # Add to the axes
+            self.ax.add_collection3d(self.infill_collection)
         self.canvas.draw_idle()
 
     def toggle_infill(self, visible=None):
@@ -186,9 +233,6 @@ class STLVisualizer:
     def _render(self):
         """Render the current mesh data."""
         try:
-            # Clear the previous mesh and set up axes
-            self._setup_axes()
-            
             # Check if we have valid data
             if len(self.vertices) == 0 or len(self.faces) == 0:
                 self._show_message("No mesh data to display")
@@ -201,18 +245,31 @@ class STLVisualizer:
                 self._show_error(error_msg)
                 return False
             
-            # Create the mesh with improved visual settings
-            triangles = self.vertices[self.faces]
-            self.mesh = Poly3DCollection(
-                triangles,
-                alpha=self.alpha,
-                linewidths=self.line_width,
-                edgecolor=self.edge_color,
-                facecolor=self.face_color
-            )
+            max_faces = self.INTERACTIVE_PREVIEW_FACES if self._interacting else self.MAX_PREVIEW_FACES
+            triangles = self._preview_triangles(max_faces)
+            large_mesh = len(triangles) > self.LARGE_MESH_FACES
             
-            # Add the collection to the plot
-            self.ax.add_collection3d(self.mesh)
+            if self.mesh is not None and self.mesh.axes is self.ax:
+                # Reuse the existing artist: clearing the axes would make
+                # mplot3d rebuild its panes, gridlines and tick labels
+                self.mesh.set_verts(triangles)
+                self.mesh.set_linewidth(0 if large_mesh else self.line_width)
+                self.mesh.set_edgecolor('none' if large_mesh else self.edge_color)
+                self.mesh.set_antialiased(not large_mesh)
+            else:
+                # Set up the axes and create the mesh with improved visual settings
+                self._setup_axes()
+                self.mesh = Poly3DCollection(
+                    triangles,
+                    alpha=self.alpha,
+                    linewidths=0 if large_mesh else self.line_width,
+                    edgecolor='none' if large_mesh else self.edge_color,
+                    facecolor=self.face_color,
+                    antialiased=not large_mesh
+                )
+                
+                # Add the collection to the plot
+                self.ax.add_collection3d(self.mesh)
             
             # Auto-scale the view with better margins
             self._auto_scale()
@@ -236,13 +293,39 @@ class STLVisualizer:
             self._show_error(error_msg)
             return False
 
+    def _preview_triangles(self, max_faces):
+        """Return the corners of at most max_faces evenly strided faces of the mesh."""
+        faces = self.faces
+        if len(faces) > max_faces:
+            stride = -(-len(faces) // max_faces)  # ceil division
+            faces = faces[::stride]
+            logger.debug("Previewing %d of %d faces", len(faces), len(self.faces))
+        return self.vertices[faces]
+    
+    def _on_interaction_start(self, event):
+        """Switch to the coarse preview when a drag starts over a large mesh."""
+        if event.inaxes is not self.ax or self.mesh is None:
+            return
+        self._interacting = True
+        if len(self.faces) > self.INTERACTIVE_PREVIEW_FACES:
+            self.mesh.set_verts(self._preview_triangles(self.INTERACTIVE_PREVIEW_FACES))
+            self.canvas.draw_idle()
+    
+    def _on_interaction_end(self, event):
+        """Restore the full preview once the mouse button is released."""
+        if not self._interacting:
+            return
+        self._interacting = False
+        if self.mesh is not None and len(self.faces) > self.INTERACTIVE_PREVIEW_FACES:
+            self.mesh.set_verts(self._preview_triangles(self.MAX_PREVIEW_FACES))
+            self.canvas.draw_idle()
+    
     def _auto_scale(self):
         """Auto-scale the view to fit the mesh with proper aspect ratio."""
-        if len(self.vertices) == 0:
+        if len(self.vertices) == 0 or self.bounds is None:
             return
             
-        min_vals = np.min(self.vertices, axis=0)
-        max_vals = np.max(self.vertices, axis=0)
+        min_vals, max_vals = self.bounds
         
         # Calculate the bounding box size
         size = max_vals - min_vals
@@ -271,6 +354,7 @@ class STLVisualizer:
         """Clear the visualization."""
         self.vertices = np.zeros((0, 3), dtype=np.float32)
         self.faces = np.zeros((0, 3), dtype=np.uint32)
+        self.bounds = None
         self.mesh = None
         self.file_path = None
         self.infill_lines = []
@@ -292,6 +376,7 @@ class STLVisualizer:
         """
         if self.mesh is not None:
             self.mesh.set_edgecolor(self.edge_color if show else 'none')
+            self.mesh.set_linewidth(self.line_width if show else 0)
             try:
                 self.canvas.draw_idle()
             except Exception as e:
@@ -312,6 +397,9 @@ class STLVisualizer:
         try:
             self.ax.clear()
             self.ax.set_axis_off()
+            # Clearing the axes removed the mesh and infill artists
+            self.mesh = None
+            self.infill_collection = None
             
             # Use text2D for proper positioning in 3D axes
             self.ax.text2D(
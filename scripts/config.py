@@ -2,8 +2,12 @@
 Configuration management for STL to GCode Converter.
 """
 
+import atexit
+import copy
 import json
 import os
+import threading
+import weakref
 from pathlib import Path
 from scripts.logger import get_logger
 from scripts.language_manager import LanguageManager
@@ -14,7 +18,8 @@ language_manager = LanguageManager()
 # Configure logging
 logger = get_logger(__name__)
 
-# Default configuration values
+# Default configuration values. Never handed out directly: every Config gets
+# its own deep copy, so nested lists and dicts are not shared
 DEFAULT_CONFIG = {
     'last_open_dir': '',
     'recent_files': [],
@@ -28,12 +33,32 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Live Config instances, flushed by a single exit handler; a weak set so the
+# handler does not keep instances alive until exit
+_instances = weakref.WeakSet()
+
+def _flush_all():
+    """Write the pending changes of every live Config."""
+    for instance in list(_instances):
+        instance._flush()
+
+atexit.register(_flush_all)
+
 class Config:
+    # Delay in seconds used to coalesce consecutive changes into a single write
+    SAVE_DELAY = 0.5
+    
     def __init__(self):
         # Store config in user's home directory under .stl_to_gcode
         self.config_dir = Path.home() / '.stl_to_gcode'
         self.config_file = self.config_dir / 'config.json'
         self.config = self._load_config()
+        
+        # Pending changes are written by a timer or at interpreter exit
+        self._dirty = False
+        self._save_timer = None
+        self._lock = threading.Lock()
+        _instances.add(self)
 
     def _load_config(self):
         """Load configuration from file or create default if not exists."""
@@ -45,17 +70,17 @@ class Config:
                 with open(self.config_file, 'r') as f:
                     config = json.load(f)
                     # Merge with defaults to ensure all keys exist
-                    return self._merge_dicts(DEFAULT_CONFIG, config)
+                    return self._merge_dicts(copy.deepcopy(DEFAULT_CONFIG), config)
             else:
                 # Create default config file
                 with open(self.config_file, 'w') as f:
                     json.dump(DEFAULT_CONFIG, f, indent=4)
-                return DEFAULT_CONFIG.copy()
+                return copy.deepcopy(DEFAULT_CONFIG)
                 
         except Exception as e:
             error_msg = language_manager.translate("config.error_loading", error=str(e))
             logger.error(error_msg)
-            return DEFAULT_CONFIG.copy()
+            return copy.deepcopy(DEFAULT_CONFIG)
     
     def _merge_dicts(self, default, custom):
         """Recursively merge two dictionaries."""
@@ -67,11 +92,36 @@ class Config:
                 result[key] = value
         return result
     
+    def _schedule_save(self):
+        """Mark the configuration as changed and (re)start the delayed save."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _flush(self):
+        """Write pending changes to file, if any."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            self._dirty = False
+        return self.save()
+    
     def save(self):
         """Save current configuration to file."""
+        # Copy under the lock so a concurrent set() cannot change the
+        # configuration while it is being written
+        with self._lock:
+            snapshot = copy.deepcopy(self.config)
         try:
             with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+                json.dump(snapshot, f, indent=4)
             return True
         except Exception as e:
             error_msg = language_manager.translate("config.error_saving", error=str(e))
@@ -93,15 +143,16 @@ class Config:
     def set(self, key, value):
         """Set a configuration value by dot notation key."""
         keys = key.split('.')
-        config = self.config
         
-        for k in keys[:-1]:
-            if k not in config or not isinstance(config[k], dict):
-                config[k] = {}
-            config = config[k]
-            
-        config[keys[-1]] = value
-        self.save()
+        with self._lock:
+            config = self.config
+            for k in keys[:-1]:
+                if k not in config or not isinstance(config[k], dict):
+                    config[k] = {}
+                config = config[k]
+                
+            config[keys[-1]] = value
+        self._schedule_save()
 
 # Singleton instance
 config = Config()
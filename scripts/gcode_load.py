@@ -100,13 +100,19 @@ def open_gcode_file(parent: Optional[QWidget] = None, file_path: Optional[str] =
         with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
             gcode_content = f.read()
         
+        # Count lines without building a list of them; a last line without
+        # a trailing newline still counts
+        line_count = gcode_content.count('\n')
+        if gcode_content and not gcode_content.endswith('\n'):
+            line_count += 1
+        
         # Update result with success information
         result.update({
             'success': True,
             'file_path': str(path.absolute()),
             'file_name': path.name,
             'file_size': file_size,
-            'line_count': len(gcode_content.splitlines())
+            'line_count': line_count
         })
         
         logger.info(language_manager.translate(
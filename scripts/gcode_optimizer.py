@@ -9,8 +9,15 @@ from typing import List, Dict, Tuple, Optional, Union, Iterator
 import math
 import re
 from collections import defaultdict
+from functools import lru_cache
 import logging
 
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    # Fall back to a vectorized linear scan when scipy is not available
+    cKDTree = None
+
 # Import the language manager
 from scripts.language_manager import LanguageManager
 
@@ -19,6 +26,18 @@ language_manager = LanguageManager()
 
 logger = logging.getLogger(__name__)
 
+# Candidates asked of the KD-tree per step of the nearest-neighbor travel path
+TRAVEL_NEIGHBORS = 32
+
+# Position of each axis word in the flat position lists used when scanning moves
+MOVE_AXES = {'X': 0, 'Y': 1, 'Z': 2, 'E': 3, 'F': 4}
+
+# The two moves written for every infill line: travel to its start, then draw it
+INFILL_LINE_TEMPLATE = (
+    "G1 X%.3f Y%.3f ; Move to start\n"
+    "G1 X%.3f Y%.3f ; Draw infill line"
+)
+
 class GCodeOptimizer:
     """
     A class containing various G-code optimization algorithms.
@@ -40,19 +59,45 @@ class GCodeOptimizer:
         if not points:
             return []
             
-        points = points.copy()
+        coords = np.asarray(points, dtype=np.float64)
+        num_points = len(coords)
+        visited = np.zeros(num_points, dtype=bool)
         optimized_path = []
-        current = np.array(current_pos)
+        current = np.asarray(current_pos, dtype=np.float64)
         
-        while points:
+        # Nearest neighbors are looked up in a KD-tree, asking for a few
+        # candidates at a time and widening the search only when all of them
+        # have already been visited. The tree is rebuilt over the unvisited
+        # points whenever half of its points have been visited, so the
+        # search does not keep wading through visited neighborhoods
+        tree = cKDTree(coords) if cKDTree is not None else None
+        tree_points = np.arange(num_points)  # Index into coords of each tree point
+        
+        for step in range(num_points):
             # Find the nearest point to current position
-            distances = [np.linalg.norm(current - np.array(p)) for p in points]
-            nearest_idx = np.argmin(distances)
-            nearest_point = points.pop(nearest_idx)
+            if tree is not None:
+                remaining = num_points - step
+                if 2 * remaining <= len(tree_points):
+                    tree_points = np.flatnonzero(~visited)
+                    tree = cKDTree(coords[tree_points])
+                k = min(TRAVEL_NEIGHBORS, len(tree_points))
+                while True:
+                    _, candidates = tree.query(current, k=k)
+                    candidates = tree_points[np.atleast_1d(candidates)]
+                    candidates = candidates[~visited[candidates]]
+                    if len(candidates) or k == len(tree_points):
+                        break
+                    k = min(k * 4, len(tree_points))
+                nearest_idx = int(candidates[0])
+            else:
+                distances = np.linalg.norm(coords - current, axis=1)
+                distances[visited] = np.inf
+                nearest_idx = int(np.argmin(distances))
             
             # Add to optimized path and update current position
-            optimized_path.append(nearest_point)
-            current = np.array(nearest_point)
+            visited[nearest_idx] = True
+            optimized_path.append(points[nearest_idx])
+            current = coords[nearest_idx]
             
         return optimized_path
     
@@ -71,7 +116,7 @@ class GCodeOptimizer:
         Returns:
             List of (x1, y1, x2, y2) line segments
         """
-        x_min, y_min, x_max, y_max = bounds
+        x_min, y_min, x_max, y_max = (float(v) for v in bounds)
         width = x_max - x_min
         height = y_max - y_min
         
@@ -79,42 +124,33 @@ class GCodeOptimizer:
         angle_rad = math.radians(angle)
         
         # Calculate the maximum distance we need to cover
-        max_dim = math.sqrt(width**2 + height**2)
+        max_dim = math.hypot(width, height)
+        
+        # Offsets of every line, accumulated the same way as stepping d by
+        # spacing one line at a time
+        count = int(max_dim / spacing) + 2
+        offsets = np.cumsum(np.concatenate(([0.0], np.full(count, float(spacing)))))
+        offsets = offsets[offsets <= max_dim]
         
         # Generate lines perpendicular to the angle
-        lines = []
-        d = 0
-        
-        while d <= max_dim:
-            # Calculate line endpoints
-            if angle < 45 or angle > 135:
-                # More horizontal lines
-                x1 = x_min - height / math.tan(angle_rad)
-                y1 = y_min
-                x2 = x_min + height / math.tan(angle_rad)
-                y2 = y_max
-                
-                # Offset the line
-                x1 += d * math.cos(angle_rad)
-                y1 += d * math.sin(angle_rad)
-                x2 += d * math.cos(angle_rad)
-                y2 += d * math.sin(angle_rad)
-            else:
-                # More vertical lines
-                x1 = x_min
-                y1 = y_min - width * math.tan(angle_rad)
-                x2 = x_max
-                y2 = y_min + width * math.tan(angle_rad)
-                
-                # Offset the line
-                x1 += d * math.cos(angle_rad)
-                y1 += d * math.sin(angle_rad)
-                x2 += d * math.cos(angle_rad)
-                y2 += d * math.sin(angle_rad)
-            
-            # Add line if it intersects the bounding box
-            lines.append((x1, y1, x2, y2))
-            d += spacing
+        if angle < 45 or angle > 135:
+            # More horizontal lines
+            x1 = x_min - height / math.tan(angle_rad)
+            y1 = y_min
+            x2 = x_min + height / math.tan(angle_rad)
+            y2 = y_max
+        else:
+            # More vertical lines
+            x1 = x_min
+            y1 = y_min - width * math.tan(angle_rad)
+            x2 = x_max
+            y2 = y_min + width * math.tan(angle_rad)
+        
+        # Offset all the lines at once
+        dx = offsets * math.cos(angle_rad)
+        dy = offsets * math.sin(angle_rad)
+        lines = list(zip((x1 + dx).tolist(), (y1 + dy).tolist(),
+                         (x2 + dx).tolist(), (y2 + dy).tolist()))
             
         return lines
     
@@ -150,7 +186,7 @@ class GCodeOptimizer:
                 prev_move = moves[i-1] if i > 0 else {'x': 0, 'y': 0, 'z': 0}
                 dx = move.get('x', prev_move.get('x', 0)) - prev_move.get('x', 0)
                 dy = move.get('y', prev_move.get('y', 0)) - prev_move.get('y', 0)
-                travel_dist = math.sqrt(dx**2 + dy**2)
+                travel_dist = math.hypot(dx, dy)
                 
                 # Add retraction if needed
                 if travel_dist >= min_travel and extruded:
@@ -231,13 +267,31 @@ class GCodeOptimizer:
         segments = []
         segment_start = 0
         
+        # Interior points where the path turns (nonzero cross product of the
+        # two edges) or where an edge is vertical. A window without any of them
+        # is an exactly straight, non-vertical run, which _are_colinear always
+        # accepts, so it is skipped without fitting a line to it. Vertical
+        # edges, zero-length ones included, are left to _are_colinear: its
+        # y = mx + c fit never accepts vertical runs, and a zero-length edge
+        # would hide a turn from the cross product
+        coords = np.asarray(points, dtype=np.float64)[:, :2]
+        edges = np.diff(coords, axis=0)
+        cross = edges[:-1, 0] * edges[1:, 1] - edges[:-1, 1] * edges[1:, 0]
+        vertical = edges[:, 0] == 0
+        bends = np.flatnonzero((cross != 0) | vertical[:-1] | vertical[1:])
+        
         while segment_start < len(points) - 2:
             best_fit = None
             best_error = float('inf')
             best_end = segment_start + 2
             
+            # Points segment_start..end are straight until end reaches past the first bend
+            next_bend = np.searchsorted(bends, segment_start)
+            first_bend = bends[next_bend] if next_bend < len(bends) else len(points)
+            
             # Try to find the longest possible arc starting at segment_start
-            for end in range(segment_start + min_points, min(segment_start + 100, len(points))):
+            for end in range(max(segment_start + min_points, first_bend + 2),
+                             min(segment_start + 100, len(points))):
                 arc_points = points[segment_start:end+1]
                 
                 # Skip colinear points
@@ -310,7 +364,7 @@ class GCodeOptimizer:
         r = np.sqrt(c[2] + xc**2 + yc**2)
         
         # Calculate fitting error
-        distances = np.sqrt((x - xc)**2 + (y - yc)**2)
+        distances = np.hypot(x - xc, y - yc)
         error = np.mean((distances - r)**2)
         
         return (xc, yc), r, error
@@ -347,18 +401,15 @@ class GCodeOptimizer:
             List of G-code commands as strings
         """
         gcode = []
-        current_pos = None
+        
+        # Everything after X/Y is the same for every line move, so build it once
+        line_suffix = f" F{feedrate}"
+        if z_height is not None:
+            line_suffix = f" Z{z_height:.3f}" + line_suffix
         
         for segment in segments:
             if segment['type'] == 'line':
-                for point in segment['points']:
-                    x, y = point
-                    cmd = f"G1 X{x:.3f} Y{y:.3f}"
-                    if z_height is not None:
-                        cmd += f" Z{z_height:.3f}"
-                    cmd += f" F{feedrate}"
-                    gcode.append(cmd)
-                    current_pos = (x, y, z_height) if z_height is not None else (x, y)
+                gcode.extend(f"G1 X{x:.3f} Y{y:.3f}{line_suffix}" for x, y in segment['points'])
             
             elif segment['type'] == 'arc':
                 # Convert arc to G2/G3 command
@@ -380,7 +431,6 @@ class GCodeOptimizer:
                     gcode_cmd = f"G1 Z{z_height:.3f} F{feedrate/2}\n" + gcode_cmd
                 
                 gcode.append(gcode_cmd)
-                current_pos = (x_end, y_end, z_height) if z_height is not None else (x_end, y_end)
         
         return gcode
 
@@ -400,7 +450,8 @@ class GCodeOptimizer:
             return []
             
         optimized = []
-        last_pos = {'X': 0, 'Y': 0, 'Z': 0, 'E': 0, 'F': 0}
+        # Position as a flat [X, Y, Z, E, F] list indexed through MOVE_AXES
+        last_pos = [0.0] * len(MOVE_AXES)
         
         for cmd in gcode_commands:
             # Skip comments and empty lines
@@ -422,29 +473,28 @@ class GCodeOptimizer:
                 continue
                 
             # Parse coordinates and parameters
-            current_pos = last_pos.copy()
+            current_pos = last_pos[:]
             has_movement = False
             
             for part in parts[1:]:
                 if not part:
                     continue
-                axis = part[0].upper()
-                if axis in current_pos:
+                index = MOVE_AXES.get(part[0].upper())
+                if index is not None:
                     try:
-                        value = float(part[1:])
-                        current_pos[axis] = value
+                        current_pos[index] = float(part[1:])
                         has_movement = True
                     except (ValueError, IndexError):
                         pass
             
             # Check if the move is redundant
             if has_movement:
-                # Calculate movement distance
-                distance_sq = 0
-                for axis in 'XYZE':
-                    if axis in current_pos and axis in last_pos:
-                        delta = current_pos[axis] - last_pos[axis]
-                        distance_sq += delta * delta
+                # Calculate movement distance over X, Y, Z and E
+                dx = current_pos[0] - last_pos[0]
+                dy = current_pos[1] - last_pos[1]
+                dz = current_pos[2] - last_pos[2]
+                de = current_pos[3] - last_pos[3]
+                distance_sq = dx * dx + dy * dy + dz * dz + de * de
                 
                 if distance_sq >= tolerance * tolerance:
                     # Non-redundant move, keep it
@@ -452,9 +502,10 @@ class GCodeOptimizer:
                     last_pos = current_pos
             else:
                 # No movement, but might have other parameters (like feedrate)
-                if 'F' in current_pos and current_pos['F'] != last_pos['F']:
-                    optimized.append(f"G1 F{current_pos['F']:.1f}")
-                    last_pos['F'] = current_pos['F']
+                feed = MOVE_AXES['F']
+                if current_pos[feed] != last_pos[feed]:
+                    optimized.append(f"G1 F{current_pos[feed]:.1f}")
+                    last_pos[feed] = current_pos[feed]
         
         return optimized
     
@@ -474,8 +525,11 @@ class GCodeOptimizer:
         if not gcode_commands:
             return []
             
-        # First pass: extract all extrusion values and their positions
+        # First pass: extract all extrusion values and their positions. The
+        # index of the E word is kept too, so the rewrite below does not have
+        # to search every command for it again
         extrusions = []
+        e_words = []
         for i, cmd in enumerate(gcode_commands):
             cmd = cmd.strip()
             if not cmd or cmd.startswith(';'):
@@ -485,11 +539,12 @@ class GCodeOptimizer:
             if not parts or parts[0] not in ('G0', 'G1'):
                 continue
                 
-            for part in parts[1:]:
+            for word, part in enumerate(parts[1:], 1):
                 if part.upper().startswith('E'):
                     try:
                         e_value = float(part[1:])
                         extrusions.append((i, e_value))
+                        e_words.append(word)
                     except (ValueError, IndexError):
                         pass
                     break
@@ -523,20 +578,11 @@ class GCodeOptimizer:
         
         # Second pass: update the G-code with smoothed extrusion values
         result = gcode_commands.copy()
-        for idx, e_value in smoothed_extrusions:
-            cmd = result[idx].strip()
-            if not cmd or cmd.startswith(';'):
-                continue
-                
+        for (idx, e_value), word in zip(smoothed_extrusions, e_words):
             # Replace the extrusion value
-            parts = cmd.split(';')
+            parts = result[idx].strip().split(';')
             gcode_parts = parts[0].split()
-            
-            # Find and update the E parameter
-            for i, part in enumerate(gcode_parts[1:], 1):
-                if part.upper().startswith('E'):
-                    gcode_parts[i] = f"E{e_value:.5f}".rstrip('0').rstrip('.')
-                    break
+            gcode_parts[word] = f"E{e_value:.5f}".rstrip('0').rstrip('.')
             
             # Reconstruct the command
             result[idx] = ' '.join(gcode_parts)
@@ -569,8 +615,9 @@ class GCodeOptimizer:
             # Apply medium-level optimizations
             optimized = GCodeOptimizer.smooth_extrusion(optimized)
             
-            # Remove empty lines and trailing whitespace
-            optimized = [line.rstrip() for line in optimized if line.strip()]
+            # Remove empty lines. Both passes above already strip every command,
+            # so there is no trailing whitespace left to trim
+            optimized = [line for line in optimized if line]
             
         if optimize_level >= 2:
             # Apply aggressive optimizations
@@ -658,6 +705,9 @@ class GCodeOptimizer:
         """
         Generate optimized infill pattern using A* path planning.
         
+        The pattern only depends on the arguments, so results are memoized:
+        layers sharing the same bounds reuse the path computed for the first.
+        
         Args:
             bounds: (x_min, y_min, x_max, y_max) bounding box for infill
             angle: Angle of infill lines in degrees (0-180)
@@ -667,6 +717,17 @@ class GCodeOptimizer:
         Returns:
             List of (x1, y1, x2, y2) line segments
         """
+        return list(GCodeOptimizer._cached_optimized_infill(
+            tuple(float(v) for v in bounds), float(angle), float(spacing), float(resolution)
+        ))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _cached_optimized_infill(bounds: Tuple[float, float, float, float],
+                                 angle: float,
+                                 spacing: float,
+                                 resolution: float) -> Tuple[Tuple[float, float, float, float], ...]:
+        """Compute the optimized infill pattern; see generate_optimized_infill."""
         try:
             # Convert angle to radians
             angle_rad = math.radians(angle)
@@ -675,7 +736,7 @@ class GCodeOptimizer:
             x_min, y_min, x_max, y_max = bounds
             width = x_max - x_min
             height = y_max - y_min
-            diagonal = math.sqrt(width**2 + height**2)
+            diagonal = math.hypot(width, height)
             
             # Generate infill lines
             lines = []
@@ -716,33 +777,37 @@ class GCodeOptimizer:
                 d += spacing
             
             if not lines:
-                return []
+                return ()
             
-            # Optimize path using nearest neighbor
-            optimized = []
-            remaining = lines.copy()
+            # Optimize path using nearest neighbor. The start and end points of
+            # all lines are kept in two arrays so each step measures the
+            # distance to every remaining line at once
+            segments = np.asarray(lines, dtype=np.float64)
+            start_xs, start_ys = segments[:, 0], segments[:, 1]
+            end_xs, end_ys = segments[:, 2], segments[:, 3]
+            remaining = np.ones(len(lines), dtype=bool)
             
             # Start with the first line
-            current = remaining.pop(0)
-            optimized.append(current)
+            remaining[0] = False
+            current = lines[0]
+            optimized = [current]
             
-            while remaining:
+            for _ in range(len(lines) - 1):
                 # Find the closest line to the current end point
                 last_x2, last_y2 = current[2], current[3]
+                start_dist = (start_xs - last_x2)**2 + (start_ys - last_y2)**2  # Start to last end
+                end_dist = (end_xs - last_x2)**2 + (end_ys - last_y2)**2        # End to last end
                 
-                # Find closest line (start or end point)
-                closest = min(remaining, 
-                             key=lambda s: min(
-                                 (s[0] - last_x2)**2 + (s[1] - last_y2)**2,  # Start to last end
-                                 (s[2] - last_x2)**2 + (s[3] - last_y2)**2   # End to last end
-                             ))
-                remaining.remove(closest)
+                # Find closest line (start or end point); argmin keeps the
+                # first of equally close lines, in their original order
+                dist = np.minimum(start_dist, end_dist)
+                dist[~remaining] = np.inf
+                index = int(np.argmin(dist))
+                remaining[index] = False
+                closest = lines[index]
                 
                 # Add the closest segment in the optimal direction
-                start_dist = (closest[0] - last_x2)**2 + (closest[1] - last_y2)**2
-                end_dist = (closest[2] - last_x2)**2 + (closest[3] - last_y2)**2
-                
-                if start_dist <= end_dist:
+                if start_dist[index] <= end_dist[index]:
                     optimized.append(closest)
                 else:
                     # Reverse the segment
@@ -751,12 +816,12 @@ class GCodeOptimizer:
                 current = optimized[-1]
             
             # Ensure all lines are tuples of 4 floats
-            return [tuple(float(x) for x in line) for line in optimized]
+            return tuple(tuple(float(x) for x in line) for line in optimized)
             
         except Exception as e:
             logging.error(f"Error in generate_optimized_infill: {e}")
             # Fall back to basic infill pattern if optimization fails
-            return GCodeOptimizer.generate_infill_pattern(bounds, angle, spacing)
+            return tuple(GCodeOptimizer.generate_infill_pattern(bounds, angle, spacing))
 
     @staticmethod
     def _clip_line_to_bounds(line: Tuple[float, float, float, float], 
@@ -878,9 +943,13 @@ class GCodeOptimizer:
             else:
                 raise ValueError(language_manager.translate("gcode_optimizer.error.unsupported_mesh_format"))
             
+            # Sort the vertices by Z once so each layer can slice out its slab
+            # with a binary search instead of masking the whole mesh
+            z_sorted = vertices[np.argsort(vertices[:, 2], kind='stable')]
+            
             # Calculate Z bounds from vertices
-            z_min = vertices[:, 2].min()
-            z_max = vertices[:, 2].max()
+            z_min = z_sorted[0, 2]
+            z_max = z_sorted[-1, 2]
             
             # Generate G-code for each layer
             current_z = z_min
@@ -888,7 +957,7 @@ class GCodeOptimizer:
                 if hasattr(self, '_is_cancelled') and self._is_cancelled:
                     return
                     
-                layer_gcode = self._generate_layer_gcode(stl_mesh, current_z)
+                layer_gcode = self._generate_layer_gcode(stl_mesh, current_z, z_sorted)
                 if layer_gcode:
                     yield layer_gcode
                 
@@ -914,13 +983,15 @@ class GCodeOptimizer:
             except Exception as e:
                 raise ValueError(language_manager.translate("gcode_optimizer.error.invalid_end_gcode", error=str(e)))
     
-    def _generate_layer_gcode(self, stl_mesh, z: float) -> str:
+    def _generate_layer_gcode(self, stl_mesh, z: float, z_sorted: np.ndarray) -> str:
         """
         Generate G-code for a single layer with infill.
         
         Args:
             stl_mesh: The STL mesh (can be a numpy array, trimesh.Trimesh, or dict)
             z: Z-coordinate of the layer
+            z_sorted: The vertices of the mesh sorted by Z, sorted once by the
+                caller so the vertices of the layer can be found by binary search
             
         Returns:
             G-code for the layer as a string
@@ -964,8 +1035,10 @@ class GCodeOptimizer:
         # Example: Generate infill if enabled
         if self.infill_density > 0:
             # Get the bounds of the current layer
-            layer_verts = vertices[(vertices[:, 2] >= z - self.layer_height/2) & 
-                                 (vertices[:, 2] <= z + self.layer_height/2)]
+            sorted_z = z_sorted[:, 2]
+            lo = np.searchsorted(sorted_z, z - self.layer_height/2, side='left')
+            hi = np.searchsorted(sorted_z, z + self.layer_height/2, side='right')
+            layer_verts = z_sorted[lo:hi]
             
             if len(layer_verts) > 0:
                 x_min, y_min = layer_verts[:, :2].min(axis=0)
@@ -994,10 +1067,9 @@ class GCodeOptimizer:
                     gcode.append("; --- Infill ---")
                     gcode.append(f"G1 F{self.infill_speed * 60:.0f} ; Set infill speed")
                     
-                    for line in infill_lines:
-                        x1, y1, x2, y2 = line
-                        gcode.append(f"G1 X{x1:.3f} Y{y1:.3f} ; Move to start")
-                        gcode.append(f"G1 X{x2:.3f} Y{y2:.3f} ; Draw infill line")
+                    # Format all the lines in one go rather than two f-strings per line
+                    coords = np.asarray(infill_lines, dtype=np.float64).ravel().tolist()
+                    gcode.append(("\n".join([INFILL_LINE_TEMPLATE] * len(infill_lines))) % tuple(coords))
         
         return "\n".join(gcode) + "\n"
     
@@ -5,18 +5,20 @@ This module provides functions to save G-code files with proper error handling
 and user feedback. It's designed to work with the main application's UI and logging system.
 """
 import os
-import logging
+import shutil
 from scripts.logger import get_logger
 from pathlib import Path
 from PyQt6.QtWidgets import QFileDialog, QMessageBox, QWidget
 from PyQt6.QtCore import QFileInfo
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging
 logger = get_logger(__name__)
 
+# Buffer size used when writing G-code files (1 MB)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
 def save_gcode_file(parent: QWidget = None, content: str = "", 
-                   default_filename: str = "") -> dict:
+                   default_filename: str = "", source_path: str = None) -> dict:
     """
     Save G-code content to a file with a file dialog.
     
@@ -24,12 +26,14 @@ def save_gcode_file(parent: QWidget = None, content: str = "",
         parent: Parent widget for dialogs
         content: The G-code content to save
         default_filename: Optional default filename to suggest
+        source_path: Optional file already holding the G-code; when given it is
+            copied to the destination and content is ignored
         
     Returns:
         dict: Dictionary containing operation status and file info
     """
     try:
-        if not content.strip():
+        if source_path is None and not content.strip():
             return {
                 'success': False,
                 'error': 'No content to save',
@@ -72,9 +76,15 @@ def save_gcode_file(parent: QWidget = None, content: str = "",
                     'error_details': 'User chose not to overwrite existing file.'
                 }
         
-        # Save the file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Save the file: copy the G-code already on disk, or encode once and
+        # write the bytes through a large buffer instead of letting text mode
+        # encode and translate newlines per chunk
+        if source_path is not None:
+            shutil.copyfile(source_path, file_path)
+        else:
+            data = content.encode('utf-8')
+            with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(data)
         
         # Get file info for the result
         file_info = QFileInfo(file_path)
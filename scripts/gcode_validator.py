@@ -284,13 +284,12 @@ class GCodeValidator:
             self._state['feedrate'] = feedrate
         
         # Check movement parameters
-        for axis in ['X', 'Y', 'Z', 'E']:
+        for axis_idx, axis in enumerate(('X', 'Y', 'Z', 'E')):
             if axis in params:
                 value = params[axis]
                 
-                # Check axis limits
-                if axis in ['X', 'Y', 'Z']:
-                    axis_idx = ['X', 'Y', 'Z'].index(axis)
+                # Check axis limits (the bed size is indexed X, Y, Z like the loop)
+                if axis != 'E':
                     max_pos = self.printer_limits.bed_size[axis_idx]
                     if value < 0 or value > max_pos:
                         self._add_issue(
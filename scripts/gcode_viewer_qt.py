@@ -6,7 +6,6 @@ and search functionality.
 """
 import os
 import re
-import logging
 from scripts.logger import get_logger
 from scripts.translations import get_language_manager
 from pathlib import Path
@@ -19,6 +18,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QTextCharFormat, QTextCursor, QColor, QFont, QTextFormat, QPainter
 
+logger = get_logger(__name__)
+
 class LineNumberArea(QFrame):
     """Widget to display line numbers for the text editor."""
     def __init__(self, editor):
@@ -161,7 +162,6 @@ class GCodeViewer(QDialog):
         
         self.current_file = None
         self.setup_ui()
-        self.setup_logging()
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -203,15 +203,6 @@ class GCodeViewer(QDialog):
         self.editor.cursorPositionChanged.connect(self.update_line_number)
         main_layout.addWidget(self.editor)
     
-    def setup_logging(self):
-        """Set up logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        self.logger = get_logger("GCodeViewer")
-    
     def open_file(self):
         """Open a G-code file."""
         file_name, _ = QFileDialog.getOpenFileName(
@@ -238,7 +229,7 @@ class GCodeViewer(QDialog):
                 self.translate("gcode_viewer.messages.file_saved")
             )
         except Exception as e:
-            self.logger.error(f"Error saving file: {e}")
+            logger.error(f"Error saving file: {e}")
             QMessageBox.critical(
                 self, 
                 self.translate("gcode_viewer.messages.error"),
@@ -278,7 +269,7 @@ class GCodeViewer(QDialog):
             self.save_btn.setEnabled(True)
             
         except Exception as e:
-            self.logger.error(f"Error loading file: {e}")
+            logger.error(f"Error loading file: {e}")
             QMessageBox.critical(
                 self, 
                 self.translate("gcode_viewer.messages.error"),
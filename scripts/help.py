@@ -5,10 +5,10 @@ This module provides a help system that supports multiple languages.
 """
 
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QTextBrowser, QPushButton, 
-                           QHBoxLayout, QTabWidget, QWidget, QMessageBox, QDialogButtonBox)
-from PyQt6.QtCore import Qt, QUrl, pyqtSignal
-from PyQt6.QtGui import QDesktopServices, QIcon
-import os
+                           QHBoxLayout, QTabWidget, QMessageBox, QApplication)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon
+from PyQt6 import sip
 from pathlib import Path
 from scripts.logger import get_logger
 from scripts.language_manager import LanguageManager
@@ -16,9 +16,77 @@ from scripts.help_translations import HELP_TRANSLATIONS
 
 logger = get_logger(__name__)
 
+# Help dialog reused across calls of show_help
+_help_dialog = None
+
+# Page wrapped around help contents that are not a full HTML document.
+# Curly braces are doubled to escape them in the format string
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {{ 
+            font-family: 'Segoe UI', Arial, sans-serif; 
+            line-height: 1.6; 
+            color: #333;
+            margin: 0;
+            padding: 0;
+        }}
+        h1, h2, h3, h4, h5, h6 {{ 
+            color: #2c3e50; 
+            margin-top: 1.5em;
+        }}
+        h1 {{ font-size: 1.8em; }}
+        h2 {{ font-size: 1.5em; }}
+        h3 {{ font-size: 1.3em; }}
+        code {{ 
+            background-color: #f5f5f5; 
+            padding: 2px 5px; 
+            border-radius: 3px; 
+            font-family: 'Consolas', 'Monaco', monospace;
+            font-size: 0.9em;
+        }}
+        pre {{
+            background-color: #f5f5f5;
+            padding: 10px;
+            border-radius: 3px;
+            overflow-x: auto;
+        }}
+        .note {{
+            background-color: #e7f4ff;
+            border-left: 4px solid #0066cc;
+            padding: 10px 15px;
+            margin: 15px 0;
+            border-radius: 0 4px 4px 0;
+        }}
+        .warning {{
+            background-color: #fff3e0;
+            border-left: 4px solid #ff9800;
+            padding: 10px 15px;
+            margin: 15px 0;
+            border-radius: 0 4px 4px 0;
+        }}
+        .tip {{
+            background-color: #e8f5e9;
+            border-left: 4px solid #4caf50;
+            padding: 10px 15px;
+            margin: 15px 0;
+            border-radius: 0 4px 4px 0;
+        }}
+    </style>
+</head>
+<body>
+    {content}
+</body>
+</html>"""
+
 class HelpDialog(QDialog):
     """A dialog displaying help information for the application."""
     
+    # Formatted help pages, keyed by their translated content
+    _html_cache = {}
+    
     def __init__(self, language_manager: LanguageManager = None, parent=None):
         """Initialize the help dialog."""
         super().__init__(parent)
@@ -38,9 +106,10 @@ class HelpDialog(QDialog):
         self.setWindowModality(Qt.WindowModality.ApplicationModal)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
         
-        # Set application icon if available
+        # Set application icon if available; the dialog inherits the one
+        # already loaded by the application, if any
         icon_path = Path("assets/icon.png")
-        if icon_path.exists():
+        if QApplication.windowIcon().isNull() and icon_path.exists():
             self.setWindowIcon(QIcon(str(icon_path)))
         
         # Create main layout
@@ -53,6 +122,7 @@ class HelpDialog(QDialog):
         
         # Add tabs
         self.tabs = {}
+        self._shown_html = {}
         tab_ids = ['welcome', 'getting_started', 'features', 'shortcuts', 'support']
         for tab_id in tab_ids:
             self._add_tab(tab_id)
@@ -127,74 +197,23 @@ class HelpDialog(QDialog):
             return
             
         content = self.tabs[tab_id]
-        html = self.translate(f"help.{tab_id}.content")
+        text = self.translate(f"help.{tab_id}.content")
         
-        # Add basic HTML structure if not present
-        if not html.strip().lower().startswith(('<!doctype', '<html>')):
-            # Use double curly braces to escape them in the format string
-            html_template = """<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-        body {{ 
-            font-family: 'Segoe UI', Arial, sans-serif; 
-            line-height: 1.6; 
-            color: #333;
-            margin: 0;
-            padding: 0;
-        }}
-        h1, h2, h3, h4, h5, h6 {{ 
-            color: #2c3e50; 
-            margin-top: 1.5em;
-        }}
-        h1 {{ font-size: 1.8em; }}
-        h2 {{ font-size: 1.5em; }}
-        h3 {{ font-size: 1.3em; }}
-        code {{ 
-            background-color: #f5f5f5; 
-            padding: 2px 5px; 
-            border-radius: 3px; 
-            font-family: 'Consolas', 'Monaco', monospace;
-            font-size: 0.9em;
-        }}
-        pre {{
-            background-color: #f5f5f5;
-            padding: 10px;
-            border-radius: 3px;
-            overflow-x: auto;
-        }}
-        .note {{
-            background-color: #e7f4ff;
-            border-left: 4px solid #0066cc;
-            padding: 10px 15px;
-            margin: 15px 0;
-            border-radius: 0 4px 4px 0;
-        }}
-        .warning {{
-            background-color: #fff3e0;
-            border-left: 4px solid #ff9800;
-            padding: 10px 15px;
-            margin: 15px 0;
-            border-radius: 0 4px 4px 0;
-        }}
-        .tip {{
-            background-color: #e8f5e9;
-            border-left: 4px solid #4caf50;
-            padding: 10px 15px;
-            margin: 15px 0;
-            border-radius: 0 4px 4px 0;
-        }}
-    </style>
-</head>
-<body>
-    {content}
-</body>
-</html>"""
-            # Format the template with the content
-            html = html_template.format(content=html)
+        # The formatted page only depends on the translated text, so it is
+        # built once per process and shared by every dialog
+        html = self._html_cache.get(text)
+        if html is None:
+            html = text
+            # Add basic HTML structure if not present
+            if not html.strip().lower().startswith(('<!doctype', '<html>')):
+                html = HTML_TEMPLATE.format(content=html)
+            self._html_cache[text] = html
         
+        # Parsing the HTML is the expensive part, skip it if the tab already shows this page
+        if self._shown_html.get(tab_id) == html:
+            return
         content.setHtml(html)
+        self._shown_html[tab_id] = html
     
     def retranslate_ui(self):
         """Update the UI with the current language."""
@@ -216,8 +235,15 @@ def show_help(parent=None, language_manager=None):
         parent: The parent widget
         language_manager: Optional LanguageManager instance
     """
+    global _help_dialog
     try:
-        dialog = HelpDialog(language_manager=language_manager, parent=parent)
+        # Build the dialog and its tabs only once per parent; it follows
+        # language changes through the language manager it was built with
+        dialog = _help_dialog
+        if (dialog is None or sip.isdeleted(dialog) or dialog.parent() is not parent
+                or (language_manager is not None and dialog.lang_manager is not language_manager)):
+            dialog = HelpDialog(language_manager=language_manager, parent=parent)
+            _help_dialog = dialog
         dialog.exec()
     except Exception as e:
         logger.error(f"Error showing help dialog: {e}", exc_info=True)
@@ -12,6 +12,11 @@ import logging
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Translations merged by the first LanguageManager; most modules create their
+# own manager at import time, so later instances reuse this instead of merging
+# the help translations again during startup
+_merged_translations = None
+
 class LanguageManager(QObject):
     """
     Manages application language settings and translations.
@@ -99,6 +104,11 @@ class LanguageManager(QObject):
 
     def _load_translations(self):
         """Load translations from the translations and help_translations modules."""
+        global _merged_translations
+        if _merged_translations is not None:
+            self._translations = _merged_translations
+            return
+        
         self._translations = {}
         
         try:
@@ -123,6 +133,9 @@ class LanguageManager(QObject):
         except ImportError as e:
             logger.error("Failed to load main translations: %s", e)
             self._translations = {"en": {}}  # Fallback to empty English translations
+            return
+        
+        _merged_translations = self._translations
 
     def set_language(self, lang_code: str) -> bool:
         """
@@ -297,6 +297,18 @@ class LogViewer(QDockWidget):
         except Exception as e:
             print(f"Error filtering logs: {e}")
     
+    def showEvent(self, event):
+        """Resume polling the log file while the viewer is visible."""
+        super().showEvent(event)
+        if not self.log_timer.isActive():
+            self.update_log_display()
+            self.log_timer.start(1000)
+    
+    def hideEvent(self, event):
+        """Stop polling the log file while the viewer is hidden."""
+        super().hideEvent(event)
+        self.log_timer.stop()
+    
     def clear_logs(self):
         """Clear the current log display."""
         self.log_display.clear()
@@ -5,12 +5,15 @@ This module provides a centralized way to configure logging for the application,
 including file and console handlers with appropriate formatting and daily log rotation.
 All log files are stored in the logs directory at the project root.
 """
+import atexit
 import logging
 import os
+import queue
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, TimedRotatingFileHandler
 from typing import Optional
 
 # Import the language manager
@@ -19,9 +22,29 @@ from .language_manager import LanguageManager
 # Flag to track if logging has been configured
 _logging_configured = False
 
+# Current log file, the buffer in front of it and the listener thread
+# writing records to the real handlers
+_log_file = None
+_log_listener = None
+_log_buffer = None
+
 # Define log directory name (relative to the project root)
 LOG_DIR = Path("logs")
 
+# Log level, taken from the STL2GCODE_LOG environment variable or a
+# --log-level=<level> command line argument (which takes precedence)
+LOG_LEVEL_ENV = "STL2GCODE_LOG"
+LOG_LEVEL_ARG = "--log-level="
+DEFAULT_LOG_LEVEL = logging.INFO
+
+# Buffering of the log file: records are written in batches of up to
+# LOG_BUFFER_CAPACITY records, at least every LOG_FLUSH_INTERVAL seconds (by the
+# listener thread) and immediately for errors, through a LOG_FILE_BUFFER_SIZE
+# bytes file buffer
+LOG_BUFFER_CAPACITY = 1024
+LOG_FLUSH_INTERVAL = 1.0
+LOG_FILE_BUFFER_SIZE = 256 * 1024
+
 class DailyRotatingFileHandler(TimedRotatingFileHandler):
     """Custom handler that creates a new log file each day with the date in the filename."""
     def __init__(self, filename: str, **kwargs):
@@ -47,6 +70,19 @@ class DailyRotatingFileHandler(TimedRotatingFileHandler):
         
         # Set the current log file name
         self.baseFilename = str(log_file.absolute())
+        
+        # Set while a batch of records is written, to flush the file only once
+        self.defer_flush = False
+    
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    errors=self.errors, buffering=LOG_FILE_BUFFER_SIZE)
+    
+    def flush(self):
+        """Flush the file, unless a batch of records is being written."""
+        if not self.defer_flush:
+            super().flush()
     
     def doRollover(self):
         """Override to create a new log file with the current date."""
@@ -69,6 +105,87 @@ class DailyRotatingFileHandler(TimedRotatingFileHandler):
         # Update the modification time for the next rollover check
         self.rolloverAt = self.rolloverAt + self.interval
 
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats the timestamp once per second instead of once per record.
+    
+    Only used with a datefmt of one-second resolution, where all records
+    logged within the same second get the same timestamp text anyway.
+    """
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt=datefmt)
+        self._cached_second = None
+        self._cached_time = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+class BufferedLogHandler(MemoryHandler):
+    """Buffer records in memory and write them to the file handler in batches.
+    
+    The buffer is written when it is full, when a record of flushLevel or
+    above arrives, or when flush_interval seconds have passed since the
+    last write.
+    """
+    def __init__(self, target: DailyRotatingFileHandler, capacity: int = LOG_BUFFER_CAPACITY,
+                 flush_interval: float = LOG_FLUSH_INTERVAL, flushLevel: int = logging.ERROR):
+        super().__init__(capacity, flushLevel=flushLevel, target=target, flushOnClose=True)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (super().shouldFlush(record) or
+                time.monotonic() - self._last_flush >= self.flush_interval)
+    
+    def flush(self):
+        """Write all buffered records, then flush the log file once."""
+        with self.lock:
+            self._last_flush = time.monotonic()
+            if not self.buffer or self.target is None:
+                return
+            self.target.defer_flush = True
+            try:
+                for record in self.buffer:
+                    self.target.handle(record)
+            finally:
+                self.target.defer_flush = False
+                self.buffer.clear()
+            self.target.flush()
+
+class FlushingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers once the queue has been idle.
+    
+    Buffered records are otherwise only written when the next record
+    arrives; waiting with a timeout lets the listener thread write them out
+    at least every flush_interval seconds without involving the GUI thread.
+    """
+    def __init__(self, queue, *handlers, flush_interval: float = LOG_FLUSH_INTERVAL,
+                 respect_handler_level: bool = False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+    
+    def dequeue(self, block: bool):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+def get_log_level() -> int:
+    """Return the log level requested on the command line or in the environment."""
+    value = os.environ.get(LOG_LEVEL_ENV, "")
+    for arg in sys.argv[1:]:
+        if arg.startswith(LOG_LEVEL_ARG):
+            value = arg[len(LOG_LEVEL_ARG):]
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else DEFAULT_LOG_LEVEL
+
 def setup_logging(language_manager: Optional[LanguageManager] = None) -> Optional[str]:
     """
     Set up logging configuration for the application with daily rotation.
@@ -79,18 +196,21 @@ def setup_logging(language_manager: Optional[LanguageManager] = None) -> Optiona
     Returns:
         str: Absolute path to the current log file or None if not applicable
     """
-    global _logging_configured
+    global _logging_configured, _log_file, _log_listener, _log_buffer
     
     # Only configure logging once
     if _logging_configured:
-        for handler in get_logger().handlers:
-            if hasattr(handler, 'baseFilename'):
-                return handler.baseFilename
-        return None
+        return _log_file
     
-    # Create a logger with the application name
+    # Create a logger with the application name; records below its level are
+    # dropped before they are even created
     logger = logging.getLogger("STLtoGCode")
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(get_log_level())
+    
+    # No format in use shows thread or process details, so skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Clear any existing handlers
     for handler in logger.handlers[:]:
@@ -109,34 +229,62 @@ def setup_logging(language_manager: Optional[LanguageManager] = None) -> Optiona
         "%Y-%m-%d %H:%M:%S"
     )
     
-    # Create formatter
-    formatter = logging.Formatter(log_format, datefmt=date_format)
+    # Create formatter; it only runs on the listener thread
+    formatter = CachedTimeFormatter(log_format, datefmt=date_format)
     
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # Create file handler with daily rotation
+    file_error = None
     try:
         file_handler = DailyRotatingFileHandler("stl_to_gcode")
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        log_file = file_handler.baseFilename
+        _log_buffer = BufferedLogHandler(file_handler)
+        handlers.append(_log_buffer)
+        _log_file = file_handler.baseFilename
     except Exception as e:
+        file_error = e
+        _log_file = None
+    
+    # The logger only enqueues records; a listener thread does the actual
+    # console and file I/O, including the periodic flush of the buffered
+    # records, so logging never blocks the GUI thread
+    log_queue = queue.Queue(-1)
+    _log_listener = FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(shutdown_logging)
+    logger.addHandler(QueueHandler(log_queue))
+    
+    if file_error is not None:
         logger.warning(
             "Failed to create log file: %s. Logging to console only.",
-            str(e),
-            exc_info=True
+            str(file_error),
+            exc_info=file_error
         )
-        log_file = None
     
     _logging_configured = True
     logger.debug("Logging configured successfully")
     
-    return log_file
+    return _log_file
+
+def flush_logs() -> None:
+    """Write the buffered log records to the log file."""
+    if _log_buffer is not None:
+        _log_buffer.flush()
+
+def shutdown_logging() -> None:
+    """Write out all queued log records and stop the logging listener thread."""
+    global _log_listener
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    flush_logs()
 
 def get_logger(name: str = None) -> logging.Logger:
     """
@@ -8,6 +8,10 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QFileDialog, QListWidget, QSplitter, QMessageBox
 )
 from PyQt6.QtCore import Qt, QUrl
+from PyQt6 import sip
+
+# Documentation viewer reused across calls of show_documentation
+_docs_viewer = None
 
 class MarkdownViewer(QDialog):
     def __init__(self, parent=None):
@@ -248,7 +252,15 @@ class MarkdownViewer(QDialog):
         pass
 
 def show_documentation(parent=None):
-    viewer = MarkdownViewer(parent)
+    global _docs_viewer
+    # Build the viewer and render the document list only once per parent
+    viewer = _docs_viewer
+    if viewer is None or sip.isdeleted(viewer) or viewer.parent() is not parent:
+        viewer = MarkdownViewer(parent)
+        _docs_viewer = viewer
+    elif viewer.file_list.count() == 0:
+        # Nothing was found last time; the docs may have been added since
+        viewer.load_documents()
     if viewer.file_list.count() > 0:
         viewer.exec()
     else:
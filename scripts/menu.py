@@ -104,6 +104,7 @@ class MenuManager:
         toggle_log_action.setShortcut("Ctrl+L")
         toggle_log_action.toggled.connect(self.parent.toggle_log_viewer)
         self.view_menu.addAction(toggle_log_action)
+        self.parent.toggle_log_viewer_action = toggle_log_action
         
         # Language submenu
         language_menu = self.view_menu.addMenu(self._tr("view_menu.language"))
@@ -18,6 +18,13 @@ from pathlib import Path
 
 logger = get_logger(__name__)
 
+# Layout of a triangle record in a binary STL file (50 bytes, little-endian)
+BINARY_TRIANGLE_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attributes', '<u2'),
+])
+
 @dataclass
 class STLHeader:
     """STL file header information."""
@@ -212,9 +219,14 @@ class MemoryEfficientSTLProcessor:
         min_bounds = np.array([np.inf, np.inf, np.inf], dtype=np.float32)
         max_bounds = np.array([-np.inf, -np.inf, -np.inf], dtype=np.float32)
         
-        for triangle in self.iter_triangles():
-            min_bounds = np.minimum(min_bounds, np.min(triangle.vertices, axis=0))
-            max_bounds = np.maximum(max_bounds, np.max(triangle.vertices, axis=0))
+        # Reduce one chunk at a time straight from the memory map, so only a
+        # chunk of triangles is ever resident instead of one object per triangle
+        for triangles in self.iter_vertex_chunks():
+            if len(triangles) == 0:
+                continue
+            points = triangles.reshape(-1, 3)
+            np.minimum(min_bounds, points.min(axis=0), out=min_bounds)
+            np.maximum(max_bounds, points.max(axis=0), out=max_bounds)
             
         return min_bounds, max_bounds
     
@@ -384,6 +396,60 @@ class MemoryEfficientSTLProcessor:
             )
         )
 
+    def iter_vertex_chunks(self, chunk_size: Optional[int] = None) -> Iterator[npt.NDArray[np.float32]]:
+        """
+        Iterate over the triangle vertices in chunks of contiguous arrays.
+        
+        Binary files are parsed in bulk straight from the memory map, one
+        structured array per chunk, instead of one triangle at a time.
+        
+        Args:
+            chunk_size: Number of triangles per chunk (default: self.chunk_size)
+            
+        Yields:
+            Arrays of shape (N, 3, 3) with the vertices of up to chunk_size triangles
+        """
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+            
+        if self._header is None:
+            self.open()
+            
+        if not self._is_binary:
+            for chunk in self.iter_chunks(chunk_size):
+                yield np.array([triangle.vertices for triangle in chunk], dtype=np.float32)
+            return
+        
+        # Never read past the end of the file, even if the header says otherwise
+        triangle_size = BINARY_TRIANGLE_DTYPE.itemsize
+        num_triangles = min(self._header.num_triangles, (len(self._mmap) - 84) // triangle_size)
+        if num_triangles < self._header.num_triangles:
+            logger.warning(
+                self.language_manager.translate(
+                    "stl_processor.warning.incomplete_triangle",
+                    expected=self._header.num_triangles * triangle_size,
+                    actual=len(self._mmap) - 84
+                )
+            )
+        
+        for start in range(0, num_triangles, chunk_size):
+            count = min(chunk_size, num_triangles - start)
+            records = np.frombuffer(
+                self._mmap, dtype=BINARY_TRIANGLE_DTYPE,
+                count=count, offset=84 + start * triangle_size
+            )
+            # Copy the vertices out, the memory map cannot be closed while a view on it exists
+            vertices = records['vertices'].copy()
+            del records
+            yield vertices
+            
+        logger.info(
+            self.language_manager.translate(
+                "stl_processor.binary_processing_complete",
+                count=num_triangles
+            )
+        )
+
     def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[List[STLTriangle]]:
         """
         Iterate over triangles in chunks to reduce memory usage.
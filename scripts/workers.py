@@ -3,11 +3,56 @@ from scripts.logger import get_logger
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread
 from typing import Dict, Any, Optional, Tuple
 import numpy as np
-from stl import mesh
 from .language_manager import LanguageManager
+from .gcode_save import WRITE_BUFFER_SIZE
 
 logger = get_logger(__name__)
 
+# Fixed start/end G-code, joined once at import and only formatted per run
+START_GCODE_TEMPLATE = "\n".join([
+    "; G-code generated by STL to GCode Converter",
+    "G21 ; Set units to millimeters",
+    "G90 ; Use absolute positioning",
+    "G1 F{travel_speed} ; Set travel speed",
+    "M104 S200 ; Start heating extruder",
+    "M140 S60 ; Start heating bed",
+    "G28 ; Home all axes",
+    "G1 Z5 F5000 ; Lift nozzle",
+    "M190 S60 ; Wait for bed temperature",
+    "M109 S200 ; Wait for extruder temperature",
+    "G92 E0 ; Reset extruder position",
+    "G1 E-1 F300 ; Retract a little",
+    "G1 Z0.4 F3000 ; Move nozzle up",
+    "G1 X3.2 Y100.0 Z0.3 F5000.0 ; Move to start position",
+    "G1 X3.2 Y20.2 Z0.3 F1500.0 E15 ; Draw first line",
+    "G1 X3.2 Y20.2 Z0.3 F5000.0 ; Move to side a little",
+    "G1 X3.2 Y20.2 Z0.2 F5000.0 ; Move to start position",
+    "G1 X3.2 Y20.2 Z0.2 F1500.0 E30 ; Draw second line",
+    "G92 E0 ; Reset extruder",
+    "G1 Z2.0 F3000 ; Move Z up a bit"
+]) + "\n"
+
+END_GCODE_TEMPLATE = "\n".join([
+    "\n; End G-code",
+    "M104 S0 ; Turn off extruder",
+    "M140 S0 ; Turn off bed",
+    "G91 ; Use relative positioning",
+    "G1 E-1 F300 ; Retract filament",
+    "G1 Z{z_hop} E-5 F3000 ; Lift and retract",
+    "G90 ; Use absolute positioning",
+    "G28 X0 ; Home X axis",
+    "M84 ; Disable steppers"
+]) + "\n"
+
+# Vertex order in which each sliced face is visited: hop to v1, then trace
+# v2-v3-v1 (the drop to the layer already leaves the nozzle on v1)
+FACE_PATH = [0, 1, 2, 0]
+
+# Layers are handed to the UI thread in batches of at least this many characters,
+# so thin layers do not each cost a queued signal and an editor update
+GCODE_CHUNK_EMIT_SIZE = 64 * 1024
+
+
 class GCodeGenerationWorker(QObject):
     """Worker class for generating G-code in a background thread."""
     
@@ -18,18 +63,25 @@ class GCodeGenerationWorker(QObject):
     gcode_chunk = pyqtSignal(str)    # Emit chunks of G-code
     preview_ready = pyqtSignal(dict)  # Emit preview data
     
-    def __init__(self, stl_mesh: mesh.Mesh, settings: Dict[str, Any], 
-                 language_manager: Optional[LanguageManager] = None):
+    def __init__(self, stl_mesh: Any, settings: Dict[str, Any], 
+                 language_manager: Optional[LanguageManager] = None,
+                 bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                 output_path: Optional[str] = None):
         """Initialize the worker with STL mesh and settings.
         
         Args:
-            stl_mesh: The STL mesh to process
+            stl_mesh: The STL mesh to process (trimesh object or dictionary)
             settings: Dictionary containing all generation settings
             language_manager: Optional LanguageManager instance for localization
+            bounds: Optional (min, max) corners of the mesh bounding box, computed
+                from the vertices if not given
+            output_path: Optional file the G-code is streamed to as it is generated
         """
         super().__init__()
         self.stl_mesh = stl_mesh
         self.settings = settings
+        self.bounds = bounds
+        self.output_path = output_path
         self._is_cancelled = False
         self.language_manager = language_manager or LanguageManager()
         
@@ -43,6 +95,12 @@ class GCodeGenerationWorker(QObject):
         self._is_cancelled = True
         logger.debug("G-code generation cancellation requested")
     
+    def _get_z_range(self, vertices):
+        """Return the (min, max) Z of the mesh, scanning the vertices at most once."""
+        if self.bounds is None:
+            self.bounds = (np.min(vertices, axis=0), np.max(vertices, axis=0))
+        return float(self.bounds[0][2]), float(self.bounds[1][2])
+    
     @pyqtSlot()
     def generate(self):
         """Generate G-code from the STL mesh."""
@@ -50,10 +108,10 @@ class GCodeGenerationWorker(QObject):
             # Extract Z coordinates for layer calculation
             if hasattr(self.stl_mesh, 'vertices'):
                 # Handle trimesh object
-                z_coords = self.stl_mesh.vertices[:, 2]
+                vertices = self.stl_mesh.vertices
             elif isinstance(self.stl_mesh, dict) and 'vertices' in self.stl_mesh:
                 # Handle dictionary mesh
-                z_coords = self.stl_mesh['vertices'][:, 2]
+                vertices = self.stl_mesh['vertices']
             else:
                 error_msg = self.language_manager.translate(
                     "worker.error.unsupported_mesh_format",
@@ -64,7 +122,7 @@ class GCodeGenerationWorker(QObject):
                 return
 
             # Calculate total layers
-            z_min, z_max = np.min(z_coords), np.max(z_coords)
+            z_min, z_max = self._get_z_range(vertices)
             total_layers = int((z_max - z_min) / self.settings['layer_height']) + 1
             
             logger.info(
@@ -84,33 +142,64 @@ class GCodeGenerationWorker(QObject):
             # Create G-code generator
             gcode_generator = self._generate_gcode()
             
-            # Process G-code in chunks
-            for i, chunk in enumerate(gcode_generator):
-                if self._is_cancelled:
-                    logger.info(
-                        self.language_manager.translate(
-                            "worker.info.generation_cancelled",
-                            default="G-code generation cancelled by user"
-                        )
-                    )
-                    break
+            # Stream the G-code to disk as well, so it never has to be
+            # rebuilt from the editor to be saved
+            output = None
+            if self.output_path:
+                output = open(self.output_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+            
+            pending = []
+            pending_length = 0
+            last_progress = None
+            
+            try:
+                # Process G-code in chunks
+                for i, chunk in enumerate(gcode_generator):
+                    if self._is_cancelled:
+                        break
+                        
+                    # Emit progress, only when the percentage actually moves
+                    progress = min(int((i / total_layers) * 100), 100)
+                    if progress != last_progress:
+                        self.progress.emit(progress, total_layers)
+                        last_progress = progress
                     
-                # Emit progress
-                progress = min(int((i / total_layers) * 100), 100)
-                self.progress.emit(progress, total_layers)
-                
-                # Emit G-code chunk
-                self.gcode_chunk.emit(chunk)
+                    if output is not None:
+                        output.write(chunk.encode('utf-8'))
+                    
+                    # Emit G-code chunks once enough of them have been collected
+                    pending.append(chunk)
+                    pending_length += len(chunk)
+                    if pending_length >= GCODE_CHUNK_EMIT_SIZE:
+                        self.gcode_chunk.emit("".join(pending))
+                        pending = []
+                        pending_length = 0
+                        
+                        # Allow other events to be processed
+                        QThread.yieldCurrentThread()
                 
-                # Allow other events to be processed
-                QThread.yieldCurrentThread()
+                if pending and not self._is_cancelled:
+                    self.gcode_chunk.emit("".join(pending))
+            finally:
+                if output is not None:
+                    output.close()
             
-            logger.info(
-                self.language_manager.translate(
-                    "worker.info.generation_complete",
-                    default="G-code generation completed successfully"
+            # The generator also stops on its own once cancelled, so the
+            # outcome is only known here
+            if self._is_cancelled:
+                logger.info(
+                    self.language_manager.translate(
+                        "worker.info.generation_cancelled",
+                        default="G-code generation cancelled by user"
+                    )
+                )
+            else:
+                logger.info(
+                    self.language_manager.translate(
+                        "worker.info.generation_complete",
+                        default="G-code generation completed successfully"
+                    )
                 )
-            )
             
         except Exception as e:
             error_msg = self.language_manager.translate(
@@ -148,6 +237,10 @@ class GCodeGenerationWorker(QObject):
                 logger.error(error_msg)
                 self.error.emit(error_msg)
                 return
+            
+            # Slice in float64: with float32 vertices the comparisons against
+            # the layer heights and the %.3f coordinates could both change
+            vertices = np.asarray(vertices, dtype=np.float64)
 
             # Get settings
             layer_height = self.settings.get('layer_height', 0.2)
@@ -157,38 +250,29 @@ class GCodeGenerationWorker(QObject):
             infill_density = self.settings.get('infill_density', 20) / 100.0  # Convert to 0-1 range
 
             # Calculate Z range
-            z_coords = vertices[:, 2]
-            z_min, z_max = np.min(z_coords), np.max(z_coords)
+            z_min, z_max = self._get_z_range(vertices)
+            
+            # Corners and Z extent of every face, computed once instead of for every layer
+            triangles = vertices[faces]
+            face_z_min = triangles[:, :, 2].min(axis=1)
+            face_z_max = triangles[:, :, 2].max(axis=1)
+            # XY coordinates of each face's tool path, gathered once so every
+            # layer only needs a single take() of its hit faces
+            face_paths = triangles[:, FACE_PATH, :2]
+            
+            # Sweep plane over the layers: a face enters the active set when the
+            # plane reaches its lowest corner and leaves it once the plane is
+            # above its highest one, so each layer only tests the faces near it
+            order = np.argsort(face_z_min, kind='stable')
+            sorted_z_min = face_z_min[order]
+            active = np.zeros(0, dtype=np.intp)
+            entered = 0
             
             # Generate layers
             current_z = z_min + layer_height  # Start just above the bottom
             
-            # Start G-code with initialization
-            gcode = [
-                "; G-code generated by STL to GCode Converter",
-                "G21 ; Set units to millimeters",
-                "G90 ; Use absolute positioning",
-                f"G1 F{travel_speed} ; Set travel speed",
-                "M104 S200 ; Start heating extruder",
-                "M140 S60 ; Start heating bed",
-                "G28 ; Home all axes",
-                "G1 Z5 F5000 ; Lift nozzle",
-                "M190 S60 ; Wait for bed temperature",
-                "M109 S200 ; Wait for extruder temperature",
-                "G92 E0 ; Reset extruder position",
-                "G1 E-1 F300 ; Retract a little",
-                "G1 Z0.4 F3000 ; Move nozzle up",
-                "G1 X3.2 Y100.0 Z0.3 F5000.0 ; Move to start position",
-                "G1 X3.2 Y20.2 Z0.3 F1500.0 E15 ; Draw first line",
-                "G1 X3.2 Y20.2 Z0.3 F5000.0 ; Move to side a little",
-                "G1 X3.2 Y20.2 Z0.2 F5000.0 ; Move to start position",
-                "G1 X3.2 Y20.2 Z0.2 F1500.0 E30 ; Draw second line",
-                "G92 E0 ; Reset extruder",
-                "G1 Z2.0 F3000 ; Move Z up a bit"
-            ]
-            
             # Yield initial G-code
-            yield "\n".join(gcode) + "\n"
+            yield START_GCODE_TEMPLATE.format(travel_speed=travel_speed)
             
             # Process each layer
             while current_z <= z_max and not self._is_cancelled:
@@ -199,28 +283,25 @@ class GCodeGenerationWorker(QObject):
                 ]
                 
                 # Find all faces that intersect with this layer
-                for face in faces:
-                    # Get the three vertices of the face
-                    v1, v2, v3 = vertices[face[0]], vertices[face[1]], vertices[face[2]]
-                    
-                    # Check if this face intersects with the current layer
-                    z_values = [v1[2], v2[2], v3[2]]
-                    min_z, max_z = min(z_values), max(z_values)
-                    
-                    if min_z <= current_z <= max_z:
-                        # This face is part of the current layer
-                        # Move to first point (with Z hop if needed)
-                        layer_gcode.append(f"G1 X{v1[0]:.3f} Y{v1[1]:.3f} Z{current_z+z_hop:.3f} F{travel_speed}")
-                        layer_gcode.append(f"G1 Z{current_z:.3f} F{feed_rate}")
-                        
-                        # Draw the triangle
-                        layer_gcode.append(f"G1 X{v1[0]:.3f} Y{v1[1]:.3f} Z{current_z:.3f} F{feed_rate}")
-                        layer_gcode.append(f"G1 X{v2[0]:.3f} Y{v2[1]:.3f} Z{current_z:.3f} F{feed_rate}")
-                        layer_gcode.append(f"G1 X{v3[0]:.3f} Y{v3[1]:.3f} Z{current_z:.3f} F{feed_rate}")
-                        layer_gcode.append(f"G1 X{v1[0]:.3f} Y{v1[1]:.3f} Z{current_z:.3f} F{feed_rate}")
-                        
-                        # Lift nozzle
-                        layer_gcode.append(f"G1 Z{current_z+z_hop:.3f} F{travel_speed}")
+                started = np.searchsorted(sorted_z_min, current_z, side='right')
+                active = np.concatenate((active, order[entered:started]))
+                entered = started
+                active = active[face_z_max[active] >= current_z]
+                hits = np.sort(active)  # Keep the faces in mesh order
+                if len(hits):
+                    # Format every face of the layer in one pass: hop over the
+                    # first vertex, drop to the layer, trace v2-v3-v1, lift.
+                    # Z and F are modal, so the trace moves only carry X and Y
+                    z = f"Z{current_z:.3f} F{feed_rate}"
+                    hop = f"Z{current_z+z_hop:.3f} F{travel_speed}"
+                    face_template = (
+                        f"G1 X%.3f Y%.3f {hop}\n"
+                        f"G1 {z}\n"
+                        + "G1 X%.3f Y%.3f\n" * 3
+                        + f"G1 {hop}\n"
+                    )
+                    coords = face_paths.take(hits, axis=0).ravel().tolist()
+                    layer_gcode.append(((face_template * len(hits)) % tuple(coords))[:-1])
                 
                 # Add infill if needed
                 if infill_density > 0 and current_z < z_max:
@@ -241,19 +322,7 @@ class GCodeGenerationWorker(QObject):
                 current_z += layer_height
             
             # End G-code
-            end_gcode = [
-                "\n; End G-code",
-                "M104 S0 ; Turn off extruder",
-                "M140 S0 ; Turn off bed",
-                "G91 ; Use relative positioning",
-                "G1 E-1 F300 ; Retract filament",
-                f"G1 Z{z_hop} E-5 F3000 ; Lift and retract",
-                "G90 ; Use absolute positioning",
-                "G28 X0 ; Home X axis",
-                "M84 ; Disable steppers"
-            ]
-            
-            yield "\n".join(end_gcode) + "\n"
+            yield END_GCODE_TEMPLATE.format(z_hop=z_hop)
             
         except Exception as e:
             error_msg = self.language_manager.translate(
@@ -344,9 +413,6 @@ class STLLoadingWorker(QObject):
                 self.error_occurred.emit(error_msg)
                 return
             
-            # Initialize triangle collection
-            vertices = []
-            faces = []
             processed_triangles = 0
             
             logger.debug(
@@ -356,8 +422,8 @@ class STLLoadingWorker(QObject):
                 )
             )
             
-            # Process triangles in chunks
-            for i, triangle in enumerate(self.stl_processor.iter_triangles()):
+            # Process triangles in chunks, each one parsed in bulk by the processor
+            for triangles in self.stl_processor.iter_vertex_chunks(self.chunk_size):
                 if self._is_cancelled:
                     logger.info(
                         self.language_manager.translate(
@@ -366,37 +432,21 @@ class STLLoadingWorker(QObject):
                         )
                     )
                     break
-                    
-                # Add triangle to current chunk
-                # Each triangle has 3 vertices, each with 3 coordinates (x,y,z)
-                # So we add 9 elements to the vertices list per triangle
-                triangle_vertices = triangle.vertices  # This is already a 3x3 array
-                
-                # Extend the vertices list with all 9 coordinates (3 vertices * 3 coords each)
-                vertices.extend([
-                    triangle_vertices[0][0], triangle_vertices[0][1], triangle_vertices[0][2],
-                    triangle_vertices[1][0], triangle_vertices[1][1], triangle_vertices[1][2],
-                    triangle_vertices[2][0], triangle_vertices[2][1], triangle_vertices[2][2]
-                ])
                 
-                # Add face indices for this triangle
-                base_idx = len(vertices) // 3 - 3  # Each vertex is 3 coordinates
-                faces.append([base_idx, base_idx+1, base_idx+2])
-                processed_triangles += 1
+                # Each triangle has its own 3 vertices, so the faces of the chunk
+                # simply index consecutive vertices
+                num_triangles = len(triangles)
+                vertices = triangles.reshape(-1, 3)
+                faces = np.arange(num_triangles * 3, dtype=np.uint32).reshape(-1, 3)
+                processed_triangles += num_triangles
                 
-                # Emit chunk if we've reached chunk size or end of file
-                if len(vertices) >= self.chunk_size * 9:  # 3 vertices * 3 coordinates per triangle
-                    self._emit_chunk(vertices, faces, processed_triangles, total_triangles)
-                    vertices = []
-                    faces = []
+                # A short chunk is the last one of the file
+                is_final = num_triangles < self.chunk_size
+                self._emit_chunk(vertices, faces, processed_triangles, total_triangles, is_final=is_final)
                     
                 # Allow other events to be processed
                 QThread.yieldCurrentThread()
             
-            # Emit any remaining triangles
-            if vertices and not self._is_cancelled:
-                self._emit_chunk(vertices, faces, processed_triangles, total_triangles, is_final=True)
-            
             if not self._is_cancelled:
                 logger.info(
                     self.language_manager.translate(
@@ -442,14 +492,15 @@ class STLLoadingWorker(QObject):
                 progress=progress
             )
             
-            logger.debug(
-                self.language_manager.translate(
-                    "worker.debug.emitting_chunk",
-                    default="Emitting chunk with {triangles} triangles, progress: {progress:.1f}%",
-                    triangles=len(vertices)//3,
-                    progress=progress
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    self.language_manager.translate(
+                        "worker.debug.emitting_chunk",
+                        default="Emitting chunk with {triangles} triangles, progress: {progress:.1f}%",
+                        triangles=len(faces),
+                        progress=progress
+                    )
                 )
-            )
             
             # Emit progress update
             self.progress_updated.emit(int(progress), 100)
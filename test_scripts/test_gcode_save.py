@@ -0,0 +1,170 @@
+"""
+Tests for saving generated G-code in the STL to GCode Converter.
+
+Usage:
+    python -m unittest test_scripts.test_gcode_save
+"""
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication, QProgressDialog, QTextEdit
+from PyQt6.Qsci import QsciScintilla
+
+import main
+from main import STLToGCodeApp
+
+
+class FakeWindow:
+    """Stand-in for the main window that runs the real G-code output methods."""
+
+    _start_gcode_output = STLToGCodeApp._start_gcode_output
+    _discard_gcode_output = STLToGCodeApp._discard_gcode_output
+    _process_gcode_chunk = STLToGCodeApp._process_gcode_chunk
+    _process_gcode_buffer = STLToGCodeApp._process_gcode_buffer
+    _on_gcode_generation_finished = STLToGCodeApp._on_gcode_generation_finished
+    _close_gcode_progress_dialog = STLToGCodeApp._close_gcode_progress_dialog
+    _cancel_gcode_generation = STLToGCodeApp._cancel_gcode_generation
+    _append_gcode_editor_text = STLToGCodeApp._append_gcode_editor_text
+    _gcode_editor_text = STLToGCodeApp._gcode_editor_text
+    _is_gcode_editor_modified = STLToGCodeApp._is_gcode_editor_modified
+    _set_gcode_editor_modified = STLToGCodeApp._set_gcode_editor_modified
+    save_gcode = STLToGCodeApp.save_gcode
+
+    def __init__(self, editor):
+        self.gcode_editor = editor
+        self.gcode_buffer = []
+        self.gcode_buffer_length = 0
+        self.gcode_buffer_size = 16  # Flush to the editor during the run
+        self.gcode_output_path = None
+        self.gcode_cancelled = False
+        self.gcode_worker = None
+        self.gcode_thread = None
+        self.progress_dialog = None
+
+    def __getattr__(self, name):
+        # Status bar, tabs and window title are not under test
+        value = MagicMock(name=name)
+        setattr(self, name, value)
+        return value
+
+
+class GCodeSaveTests:
+    """Test that saving writes the G-code shown in the editor."""
+
+    editor_class = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.window = FakeWindow(self.editor_class())
+
+    def tearDown(self):
+        self.window._discard_gcode_output()
+
+    def _editor_text(self):
+        return self.window._gcode_editor_text(self.window.gcode_editor)
+
+    def _start_run(self):
+        """Start a run the way generate_gcode does, with a real progress dialog."""
+        self.window._start_gcode_output()
+        self.window.gcode_worker = MagicMock(name='gcode_worker')
+        self.window.gcode_thread = MagicMock(name='gcode_thread')
+        self.window.progress_dialog = QProgressDialog("Generating G-code...", "Cancel", 0, 100)
+        self.window.progress_dialog.canceled.connect(self.window._cancel_gcode_generation)
+        self.window.progress_dialog.show()
+
+    def _run_generation(self, chunks):
+        """Simulate a generation run: the worker streams to the file and emits chunks."""
+        self._start_run()
+        with open(self.window.gcode_output_path, 'w', encoding='utf-8') as f:
+            f.write("".join(chunks))
+        for chunk in chunks:
+            self.window._process_gcode_chunk(chunk)
+        self.window._on_gcode_generation_finished()
+
+    def _save(self):
+        """Save through save_gcode and return the arguments passed to save_gcode_file."""
+        result = {'success': True, 'file_path': 'out.gcode', 'file_name': 'out.gcode'}
+        with patch.object(main, 'save_gcode_file', return_value=result) as save_file:
+            self.assertTrue(self.window.save_gcode('out.gcode'))
+        return save_file.call_args.kwargs
+
+    def _saved_content(self):
+        """Return what save_gcode would write to disk."""
+        kwargs = self._save()
+        if kwargs['source_path']:
+            with open(kwargs['source_path'], encoding='utf-8') as f:
+                return f.read()
+        return kwargs['content']
+
+    def test_finished_run_keeps_streamed_file(self):
+        """Closing the progress dialog at the end of a run does not cancel it."""
+        self._run_generation(["; generated\n", "G1 X1 Y1\n" * 4])
+
+        self.assertFalse(self.window.gcode_cancelled)
+        self.assertIsNotNone(self.window.gcode_output_path)
+        self.assertTrue(os.path.exists(self.window.gcode_output_path))
+        self.assertEqual(self._save()['source_path'], self.window.gcode_output_path)
+
+    def test_generate_generate_save(self):
+        """A second run replaces the first one in the editor and in the saved file."""
+        self._run_generation(["; first run\n", "G1 X1 Y1\n" * 4])
+        self._run_generation(["; second run\n", "G1 X2 Y2\n" * 4])
+
+        editor_text = self._editor_text()
+        self.assertIn("second run", editor_text)
+        self.assertNotIn("first run", editor_text)
+        self.assertEqual(self._saved_content(), editor_text)
+
+    def test_generate_after_loaded_file(self):
+        """G-code loaded into the editor is replaced by the generated G-code."""
+        self.window._append_gcode_editor_text("; loaded file\nG1 X9 Y9\n")
+        self._run_generation(["; generated\n", "G1 X1 Y1\n"])
+
+        editor_text = self._editor_text()
+        self.assertNotIn("loaded file", editor_text)
+        self.assertEqual(self._saved_content(), editor_text)
+
+    def test_cancelled_run_leaves_no_output(self):
+        """Blocks flushed to the editor before a cancel are removed with the rest."""
+        self._start_run()
+        for chunk in ["; cancelled run\n", "G1 X1 Y1\n" * 4, "G1 X2 Y2\n"]:
+            self.window._process_gcode_chunk(chunk)
+        self.assertIn("cancelled run", self._editor_text())
+
+        self.window.progress_dialog.canceled.emit()  # The Cancel button
+        self.assertTrue(self.window.gcode_cancelled)
+        self.window._on_gcode_generation_finished()
+
+        self.assertEqual(self._editor_text(), "")
+        self.assertIsNone(self.window.gcode_output_path)
+
+    def test_edited_output_saves_editor_text(self):
+        """Once the user edits the output, the editor text is saved instead of the file."""
+        self._run_generation(["; generated\n", "G1 X1 Y1\n"])
+        self.window.gcode_editor.append("; edited")
+
+        kwargs = self._save()
+        self.assertIsNone(kwargs['source_path'])
+        self.assertEqual(kwargs['content'], self._editor_text())
+
+
+class TestGCodeSaveScintilla(GCodeSaveTests, unittest.TestCase):
+    """The G-code view tab's editor, created by UI.create_text_editor."""
+
+    editor_class = QsciScintilla
+
+
+class TestGCodeSaveTextEdit(GCodeSaveTests, unittest.TestCase):
+    """The editor tab's plain text editor."""
+
+    editor_class = QTextEdit
+
+
+if __name__ == '__main__':
+    unittest.main()
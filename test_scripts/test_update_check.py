@@ -2,8 +2,7 @@
 Test script for verifying update check functionality.
 Run this script to test different update scenarios.
 """
-import 
-from scripts.logger import get_loggersys
+import sys
 from PyQt6.QtWidgets import QApplication, QMessageBox
 
 try: